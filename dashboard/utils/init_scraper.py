@@ -1,6 +1,8 @@
 import os
+import atexit
 import asyncio
 import logging
+import threading
 import traceback
 from pathlib import Path
 
@@ -10,8 +12,14 @@ from dashboard.models import LienData, RealEstateData
 from dashboard.utils.state import stop_scraper_flag
 from scrapers.lien_index_scraper import LienIndexScraper
 from scrapers.realestate_index_scraper import RealEstateIndexScraper
+from scrapers.browser_pool import close_browser
 from dashboard.utils.find_excel import find_latest_excel_file
 
+try:
+    import uvloop  # optional: faster event loop for the Playwright-bound scrapers (not on Windows)
+except ImportError:
+    uvloop = None
+
 
 # ------------------ LOGGER SETUP -------------------
 BASE_DIR = Path(settings.BASE_DIR)
@@ -30,6 +38,37 @@ os.makedirs(REAL_ESTATE_DOCUMENTS_DIR, exist_ok=True)
 # ---------------------------------------------------
 
 
+# one long-lived event loop for every scraper run, so the Playwright browser launched by the
+# first run stays warm for the next form submission instead of a cold start per run
+_scraper_loop = None
+_scraper_loop_lock = threading.Lock()
+
+
+def get_scraper_loop():
+    """Return the shared scraper event loop (uvloop when installed), starting it on first use"""
+    global _scraper_loop
+    with _scraper_loop_lock:
+        if _scraper_loop is None:
+            _scraper_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            threading.Thread(target=_scraper_loop.run_forever, name="scraper-loop", daemon=True).start()
+            atexit.register(_shutdown_scraper_loop)
+        return _scraper_loop
+
+
+def _shutdown_scraper_loop():
+    """Close the shared browser on process exit"""
+    try:
+        asyncio.run_coroutine_threadsafe(close_browser(), _scraper_loop).result(timeout=15)
+    except Exception:
+        pass  # exiting anyway; Chrome goes down with the Playwright driver
+    _scraper_loop.call_soon_threadsafe(_scraper_loop.stop)
+
+
+def run_async(coro):
+    """Run a scraper coroutine on the shared scraper loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coro, get_scraper_loop()).result()
+
+
 def run_lien_scraper(params: dict):
     """Run lien scraper and save results to database"""
     try:
@@ -37,7 +76,7 @@ def run_lien_scraper(params: dict):
         stop_scraper_flag['lien'] = False
         
         scraper = LienIndexScraper()
-        asyncio.run(scraper.scrape(params))
+        run_async(scraper.scrape(params))
         
         if stop_scraper_flag['lien']:
             print("Lien scraper stopped by user command.")
@@ -114,7 +153,7 @@ def run_realestate_scraper(params: dict):
         
         # Run the real estate scraper
         scraper = RealEstateIndexScraper()
-        asyncio.run(scraper.scrape(params))
+        run_async(scraper.scrape(params))
 
         if stop_scraper_flag['realestate']:
             print("Real estate scraper stopped by user command.")
@@ -11,9 +11,11 @@ Usage:
 
 import os
 os.environ["DISABLE_MODEL_SOURCE_CHECK"] = "True"
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")  # single-threaded Tesseract, parallelism is per call
 
 import re
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -27,6 +29,12 @@ from functools import lru_cache
 from paddleocr import PaddleOCR
 from rich.console import Console
 
+# optional in-process Tesseract binding; falls back to the pytesseract subprocess wrapper
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
 
 # ----------------- SETUP ----------------- #
 console = Console()
@@ -49,6 +57,8 @@ TOTAL_DECIMAL_RE = re.compile(r"(?is)\bTOTAL\b.{0,80}[\d,]+\.\d{2}")
 DECIMAL_RE = re.compile(r"[\d,]+\.\d{2}")
 DESCRIPTION_RE = re.compile(r"(?i)\bDESCRIPTION\b")
 USE_SLOW_DENOISE = False
+# page width the preprocess upscale factors were tuned on; wider pages get proportionally less
+UPSCALE_BASE_WIDTH = 1000
 
 STATE_ZIP_RE = re.compile(
     rf"\b(?:{'|'.join(US_STATE_ABBRS)})\b\s*,?\s*\d{{5}}(?:-\d{{4}})?\b",
@@ -87,6 +97,13 @@ ADDR_GARBAGE_RE = re.compile(
 
 
 #----------------- OCR HELPERS ----------------- #
+# fixed-size table-line elements, built once instead of per call
+_LINE_KERNELS = (
+    cv2.getStructuringElement(cv2.MORPH_RECT, (60, 1)),
+    cv2.getStructuringElement(cv2.MORPH_RECT, (1, 60)),
+)
+
+
 @lru_cache(maxsize=1)
 def get_paddle_ocr():
     return PaddleOCR(
@@ -141,8 +158,7 @@ def _remove_table_lines(gray: np.ndarray) -> np.ndarray:
 
     inv = cv2.bitwise_not(gray)
 
-    h_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (60, 1))
-    v_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 60))
+    h_kernel, v_kernel = _LINE_KERNELS
 
     horiz = cv2.morphologyEx(inv, cv2.MORPH_OPEN, h_kernel, iterations=1)
     vert = cv2.morphologyEx(inv, cv2.MORPH_OPEN, v_kernel, iterations=1)
@@ -222,6 +238,90 @@ def _recover_table_text(img_bgr: np.ndarray, *, want_description: bool = False)
     return "\n".join(out_lines).strip()
 
 
+# one tesserocr API per (thread, psm): PyTessBaseAPI is not thread-safe and the dawg
+# switches in _tess_cfg are init-only, so they cannot be toggled on a shared handle
+_TESS_LOCAL = threading.local()
+_TESS_INIT_VARS = {"preserve_interword_spaces": "1", "load_system_dawg": "0", "load_freq_dawg": "0"}
+
+
+def _tess_api(psm: int):
+    apis = getattr(_TESS_LOCAL, "apis", None)
+    if apis is None:
+        apis = _TESS_LOCAL.apis = {}
+    api = apis.get(psm)
+    if api is None:
+        api = apis[psm] = tesserocr.PyTessBaseAPI(lang="eng", psm=psm, variables=_TESS_INIT_VARS)
+    return api
+
+
+def _tess_set_image(api, img: np.ndarray) -> None:
+    """Hand an OpenCV image (gray or BGR) to tesserocr as raw bytes."""
+    if img.ndim == 2:
+        buf, bpp = np.ascontiguousarray(img), 1
+    else:
+        buf, bpp = cv2.cvtColor(img, cv2.COLOR_BGR2RGB), 3
+    h, w = buf.shape[:2]
+    api.SetImageBytes(buf.tobytes(), w, h, bpp, w * bpp)
+
+
+def _tess_string(img: np.ndarray, psm: int) -> str:
+    if tesserocr is None:
+        return pytesseract.image_to_string(cv_to_pil(img), config=_tess_cfg(psm))
+    api = _tess_api(psm)
+    _tess_set_image(api, img)
+    return api.GetUTF8Text()
+
+
+def _tess_data(img: np.ndarray, psm: int) -> Dict[str, Any]:
+    """image_to_data-shaped word dict (text/box/conf + block/par/line numbering)."""
+    if tesserocr is None:
+        return pytesseract.image_to_data(cv_to_pil(img), config=_tess_cfg(psm), output_type=Output.DICT)
+
+    api = _tess_api(psm)
+    _tess_set_image(api, img)
+    api.Recognize()
+    return _tess_api_data(api)
+
+
+def _tess_string_data(img: np.ndarray, psm: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Plain text plus word dict from ONE recognition; word dict is None without tesserocr."""
+    if tesserocr is None:
+        return _tess_string(img, psm), None
+    api = _tess_api(psm)
+    _tess_set_image(api, img)
+    api.Recognize()
+    data = _tess_api_data(api)
+    return api.GetUTF8Text(), data  # GetUTF8Text reuses the Recognize() result
+
+
+def _tess_api_data(api) -> Dict[str, Any]:
+    """Word dict from the last Recognize() on `api`."""
+    keys = ("text", "left", "top", "width", "height", "conf", "block_num", "par_num", "line_num", "word_num")
+    data: Dict[str, Any] = {k: [] for k in keys}
+    it = api.GetIterator()
+    if it is None:
+        return data
+
+    RIL = tesserocr.RIL
+    block = par = line = word = 0
+    for w in tesserocr.iterate_level(it, RIL.WORD):
+        if w.IsAtBeginningOf(RIL.BLOCK):
+            block, par, line = block + 1, 0, 0
+        if w.IsAtBeginningOf(RIL.PARA):
+            par, line = par + 1, 0
+        if w.IsAtBeginningOf(RIL.TEXTLINE):
+            line, word = line + 1, 0
+        word += 1
+        box = w.BoundingBox(RIL.WORD)
+        if box is None:
+            continue
+        x0, y0, x1, y1 = box
+        for k, v in zip(keys, (w.GetUTF8Text(RIL.WORD) or "", x0, y0, x1 - x0, y1 - y0,
+                               w.Confidence(RIL.WORD), block, par, line, word)):
+            data[k].append(v)
+    return data
+
+
 def _tess_cfg(psm: int) -> str:
     # keep psm per pass, maximize recall, avoid dictionary "corrections"
     return (
@@ -232,8 +332,7 @@ def _tess_cfg(psm: int) -> str:
 
 
 def _tess_text(img: np.ndarray, psm: int) -> str:
-    pil_img = cv_to_pil(_to_bgr(img))
-    return pytesseract.image_to_string(pil_img, config=_tess_cfg(psm))
+    return _tess_string(img, psm)
 
 
 def _paddle_lines(img_bgr: np.ndarray) -> List[str]:
@@ -279,9 +378,14 @@ def ensemble_ocr(
     *,
     preprocessed: Optional[np.ndarray] = None,
     preprocessed_data: Optional[np.ndarray] = None,
-) -> Tuple[str, Dict[str, Any]]:
+    return_text_data: bool = False,
+):
+    """
+    (text, word data); with return_text_data also the word data of the text pass itself,
+    taken from the same recognition when tesserocr is available (else None).
+    """
     pre = preprocessed if preprocessed is not None else preprocess_image(img_bgr)
-    base_text = ocr_image(pre)
+    base_text, text_data = _tess_string_data(pre, 6)
     base_data_img = preprocessed_data if preprocessed_data is not None else pre
     base_data = ocr_data(base_data_img)
 
@@ -294,50 +398,11 @@ def ensemble_ocr(
         if extra:
             base_text = base_text + "\n" + extra
 
+    if return_text_data:
+        return base_text, base_data, text_data
     return base_text, base_data
 
 
-def ocr_data(img: np.ndarray):
-    pil_img = cv_to_pil(img)
-    return pytesseract.image_to_data(pil_img, config="--oem 3 --psm 6", output_type=Output.DICT)
-
-
-def data_to_lines(data):
-    n = len(data.get("text", []))
-    items = []
-    for i in range(n):
-        txt = str(data["text"][i]).strip()
-        if not txt:
-            continue
-        items.append({
-            "text": txt,
-            "left": int(data["left"][i]),
-            "top": int(data["top"][i]),
-            "width": int(data["width"][i]),
-            "height": int(data["height"][i]),
-            "block": int(data["block_num"][i]),
-            "par": int(data["par_num"][i]),
-            "line": int(data["line_num"][i]),
-        })
-
-    groups = {}
-    for it in items:
-        groups.setdefault((it["block"], it["par"], it["line"]), []).append(it)
-
-    lines = []
-    for _, words in groups.items():
-        words = sorted(words, key=lambda w: w["left"])
-        text = " ".join(w["text"] for w in words)
-        l = min(w["left"] for w in words)
-        t = min(w["top"] for w in words)
-        r = max(w["left"] + w["width"] for w in words)
-        b = max(w["top"] + w["height"] for w in words)
-        lines.append({"text": text, "bbox": (l, t, r, b)})
-
-    lines.sort(key=lambda x: x["bbox"][1])
-    return lines
-
-
 # ----------------- Main ----------------- #
 def pil_to_cv(img: Image.Image) -> np.ndarray:
     """Convert a PIL image to an OpenCV BGR numpy array."""
@@ -346,6 +411,8 @@ def pil_to_cv(img: Image.Image) -> np.ndarray:
 
 def cv_to_pil(img: np.ndarray) -> Image.Image:
     """Convert OpenCV BGR image to PIL."""
+    if img.ndim == 2:
+        return Image.fromarray(img)  # grayscale / binary, no channel swap needed
     return Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
 
 
@@ -353,9 +420,12 @@ def preprocess_image(img: np.ndarray, *, upscale: float = 2.0) -> np.ndarray:
     if img is None:
         raise ValueError("input image is None (cv2.imread failed)")
 
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
 
-    # Upscale helps a LOT for small fonts (your scan is ~1000px wide)
+    # Upscale helps a LOT for small fonts (your scan is ~1000px wide); aim for the same output
+    # width on larger pages instead of blowing them up too (Tesseract time scales with pixels)
+    if upscale and upscale != 1.0:
+        upscale = min(upscale, max(1.0, upscale * UPSCALE_BASE_WIDTH / gray.shape[1]))
     if upscale and upscale != 1.0:
         gray = cv2.resize(gray, (0, 0), fx=upscale, fy=upscale, interpolation=cv2.INTER_CUBIC)
 
@@ -380,19 +450,12 @@ def ocr_image(img: np.ndarray) -> str:
     Run Tesseract OCR on a preprocessed image and return plain text.
     Assumes image is already correctly oriented (vertical).
     """
-    pil_img = cv_to_pil(img)
-    text = pytesseract.image_to_string(pil_img, config=_tess_cfg(6))
-    return text
+    return _tess_string(img, 6)
 
 
 def ocr_data(img: np.ndarray) -> Dict[str, Any]:
     """Tesseract OCR that returns word-level data with bounding boxes."""
-    pil_img = cv_to_pil(img)
-    return pytesseract.image_to_data(
-        pil_img,
-        config=_tess_cfg(6),
-        output_type=Output.DICT,
-    )
+    return _tess_data(img, 6)
 
 
 def data_to_lines(data: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -727,9 +790,12 @@ def process_cv2_image(img: np.ndarray) -> Dict[str, Any]:
     takes an already-loaded OpenCV image.
     """
     print("Preprocessing image...")
-    pre_text = preprocess_image(img, upscale=2.0)
-    pre_data = preprocess_image(img, upscale=1.5)
-    text, data = ensemble_ocr(img, preprocessed=pre_text, preprocessed_data=pre_data)
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img is not None else None  # shared by both passes
+    pre_text = preprocess_image(gray, upscale=2.0)
+    pre_data = preprocess_image(gray, upscale=1.5)
+    text, data, data_hi = ensemble_ocr(
+        img, preprocessed=pre_text, preprocessed_data=pre_data, return_text_data=True
+    )
     
     print(f"********\n{text}\n********")
     
@@ -739,8 +805,10 @@ def process_cv2_image(img: np.ndarray) -> Dict[str, Any]:
     addresses = extract_address_blocks(ocr_lines, image_width=int(pre_text.shape[1]))
     
     # If lower-res word boxes missed addresses, fallback once to hi-res boxes only
+    # (already recognised by the text pass when tesserocr is available)
     if not addresses:
-        data_hi = ocr_data(pre_text)
+        if data_hi is None:
+            data_hi = ocr_data(pre_text)
         ocr_lines_hi = data_to_lines(data_hi)
         addresses = extract_address_blocks(ocr_lines_hi, image_width=int(pre_text.shape[1]))
 
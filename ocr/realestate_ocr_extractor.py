@@ -1,18 +1,29 @@
 import argparse
+import atexit
 import os
 import re
 import json
 import hashlib
+import threading
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Tuple
 
+# single-threaded Tesseract; batches are parallelised with --workers instead
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 import cv2
 import numpy as np
 from PIL import Image
 import pytesseract
 from multiprocessing import Pool, cpu_count
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import tesserocr  # optional: in-process Tesseract, model loaded once per thread
+except ImportError:
+    tesserocr = None
 
 # ----------------------------
 # Config / Patterns
@@ -86,10 +97,13 @@ class ExtractedRE:
 
 def imread_unicode(path: str) -> np.ndarray:
     """cv2.imread that works with unicode paths on mac/windows."""
-    data = np.fromfile(path, dtype=np.uint8)
-    img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+    return imdecode_bytes(np.fromfile(path, dtype=np.uint8), path)
+
+def imdecode_bytes(data, name: str, flags: int = cv2.IMREAD_COLOR) -> np.ndarray:
+    """Decode an encoded image (file contents or in-memory screenshot) to BGR (or `flags`)."""
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
     if img is None:
-        raise ValueError(f"Failed to read image: {path}")
+        raise ValueError(f"Failed to read image: {name}")
     return img
 
 def resize_if_needed(img: np.ndarray, target_w: int = 1600) -> np.ndarray:
@@ -103,7 +117,7 @@ def resize_if_needed(img: np.ndarray, target_w: int = 1600) -> np.ndarray:
 
 def preprocess_for_ocr(img: np.ndarray) -> np.ndarray:
     """Fast preprocessing: grayscale + light thresholding."""
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
     # mild denoise
     gray = cv2.GaussianBlur(gray, (3, 3), 0)
     # adaptive threshold (works well for scanned docs)
@@ -125,7 +139,42 @@ def crop_roi(img: np.ndarray, x1: float, y1: float, x2: float, y2: float) -> np.
         return img
     return img[Y1:Y2, X1:X2]
 
+# header/body/prop ROIs are OCR'd side by side; each tesseract call is single-threaded, so
+# one thread per core lets the ROIs of several concurrently scraped documents overlap too
+_ROI_POOL = ThreadPoolExecutor(max_workers=max(3, cpu_count()), thread_name_prefix="re-roi-ocr")
+
+# one tesserocr API per worker thread, reused for every ROI of every page instead of
+# spawning a tesseract process (and reloading the LSTM model) per ROI. _ROI_POOL is shared
+# by every run, so the APIs live as long as the process and are only ended at exit.
+_TESS_LOCAL = threading.local()
+_TESS_APIS = []
+
+def _tess_api():
+    api = getattr(_TESS_LOCAL, "api", None)
+    if api is None:
+        api = _TESS_LOCAL.api = tesserocr.PyTessBaseAPI(
+            lang="eng", psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY
+        )
+        _TESS_APIS.append(api)
+    return api
+
+@atexit.register
+def _close_tess_apis() -> None:
+    """Release every thread's tesserocr API at interpreter exit."""
+    _ROI_POOL.shutdown(wait=True)
+    for api in _TESS_APIS:
+        api.End()
+    _TESS_APIS.clear()
+
 def ocr_tesseract(img_bin: np.ndarray, config: str) -> str:
+    """`config` is for the pytesseract fallback; the tesserocr API is fixed to --oem 1 --psm 6."""
+    if tesserocr is not None:
+        api = _tess_api()
+        buf = np.ascontiguousarray(img_bin)
+        h, w = buf.shape[:2]
+        bpp = 1 if buf.ndim == 2 else buf.shape[2]
+        api.SetImageBytes(buf.tobytes(), w, h, bpp, w * bpp)
+        return api.GetUTF8Text().strip()
     pil = Image.fromarray(img_bin)
     text = pytesseract.image_to_string(pil, lang="eng", config=config)
     return text.strip()
@@ -277,9 +326,11 @@ def try_paddle_addresses_amount(img_bgr: np.ndarray) -> Tuple[List[str], str]:
 # ----------------------------
 
 def file_cache_key(path: Path) -> str:
-    st = path.stat()
-    base = f"{path.resolve()}|{st.st_size}|{int(st.st_mtime)}"
-    return hashlib.sha1(base.encode("utf-8")).hexdigest()
+    # keyed on content, not path/mtime: the scraper re-screenshots the same page on every run
+    return bytes_cache_key(path.read_bytes())
+
+def bytes_cache_key(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 def load_cache(cache_dir: Path, key: str) -> Optional[Dict]:
     fp = cache_dir / f"{key}.json"
@@ -304,42 +355,48 @@ def extract_from_image(
     use_paddle: bool = False,
     cache_dir: Optional[str] = None,
     debug: bool = False,
+    img_bytes: Optional[bytes] = None,
 ) -> ExtractedRE:
+    """`img_bytes` (an encoded image already in memory) is used instead of reading `img_path`."""
     p = Path(img_path)
     result = ExtractedRE(file=p.name)
 
+    # read once: the same bytes feed the cache key and the decode
+    data = p.read_bytes() if img_bytes is None else img_bytes
+
     # Cache
     cache_path = Path(cache_dir) if cache_dir else None
-    key = file_cache_key(p)
+    key = bytes_cache_key(data)
     if cache_path:
         cached = load_cache(cache_path, key)
         if cached:
             return ExtractedRE(**cached)
 
-    # Read + downscale
-    img_bgr = imread_unicode(str(p))
-    img_bgr = resize_if_needed(img_bgr, target_w=1600)
+    # Read + downscale; Tesseract only needs gray, colour is decoded just for paddle
+    if use_paddle:
+        img_bgr = resize_if_needed(imdecode_bytes(data, str(p)), target_w=1600)
+        page = img_bgr
+    else:
+        page = resize_if_needed(imdecode_bytes(data, str(p), cv2.IMREAD_GRAYSCALE), target_w=1600)
+
+    # Preprocess the page once; the ROIs below overlap (prop sits inside body)
+    page_bin = preprocess_for_ocr(page)
 
     # ROIs (relative coords)
     # Header: top-right area where "Filed and Recorded ..." + date appears
-    header_roi = crop_roi(img_bgr, x1=0.55, y1=0.00, x2=1.00, y2=0.18)
+    header_bin = crop_roi(page_bin, x1=0.55, y1=0.00, x2=1.00, y2=0.18)
 
     # Body: main paragraph area (avoid giant legal description block if possible)
-    body_roi = crop_roi(img_bgr, x1=0.05, y1=0.18, x2=0.95, y2=0.65)
+    body_bin = crop_roi(page_bin, x1=0.05, y1=0.18, x2=0.95, y2=0.65)
 
     # Property snippet area often around early body — this is a second, narrower crop
-    prop_roi = crop_roi(img_bgr, x1=0.05, y1=0.25, x2=0.95, y2=0.50)
-
-    # Preprocess
-    header_bin = preprocess_for_ocr(header_roi)
-    body_bin = preprocess_for_ocr(body_roi)
-    prop_bin = preprocess_for_ocr(prop_roi)
+    prop_bin = crop_roi(page_bin, x1=0.05, y1=0.25, x2=0.95, y2=0.50)
 
     # Tesseract configs (fast)
     cfg = "--oem 1 --psm 6"
-    header_text = ocr_tesseract(header_bin, cfg)
-    body_text = ocr_tesseract(body_bin, cfg)
-    prop_text = ocr_tesseract(prop_bin, cfg)
+    header_text, body_text, prop_text = _ROI_POOL.map(
+        ocr_tesseract, (header_bin, body_bin, prop_bin), (cfg, cfg, cfg)
+    )
 
     # Detect cancellation/foreclosure early
     joined = "\n".join([header_text, body_text, prop_text])
@@ -412,10 +469,12 @@ def extract_re_fields_from_image(
     use_paddle: bool = False,
     cache_dir: Optional[str] = None,
     debug: bool = False,
+    img_bytes: Optional[bytes] = None,
 ) -> Dict[str, str]:
     """
     Public API for the scraper:
     returns a dictionary ready to data.update(...)
+    `img_bytes` lets the scraper pass its in-memory screenshot; `img_path` then only names it.
 
     - If doc is cancelled/foreclosed => returns {"SKIP_REASON": "..."}
     - Else returns your required columns as keys.
@@ -425,6 +484,7 @@ def extract_re_fields_from_image(
         use_paddle=use_paddle,
         cache_dir=cache_dir,
         debug=debug,
+        img_bytes=img_bytes,
     )
     return extractedre_to_dict(r)
 # ----------------------------
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import lxml.html
+from lxml import etree
+import playwright.async_api as pw
+
+# ---------- Shared browser ------------------------------------------------------
+# One Chrome instance per headless mode for every scraper run on the long-lived scraper loop
+# (dashboard.utils.init_scraper.run_async); runs only open/close their own contexts.
+LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--start-maximized",
+    "--no-proxy-server",
+]
+
+_playwright = None
+# one browser per launch mode, so headed and headless runs never share a browser
+_browsers = {}
+_lock = asyncio.Lock()
+# the login state last written to cookies.json, handed to new contexts without a re-read
+_session_state = None
+
+
+async def acquire_browser(headless: bool):
+    """ Return the shared browser for `headless`, launching it on first use or after it went away. """
+    global _playwright
+    async with _lock:
+        browser = _browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            if _playwright is None:
+                _playwright = await pw.async_playwright().start()
+            browser = _browsers[headless] = await _playwright.chromium.launch(
+                headless=headless,
+                channel="chrome",
+                args=LAUNCH_ARGS,
+            )
+        return browser
+
+
+async def close_browser():
+    """ Close the shared browsers and stop Playwright (process exit). """
+    global _playwright
+    async with _lock:
+        for browser in _browsers.values():
+            try:
+                await browser.close()
+            except pw.Error:
+                pass  # already gone
+        _browsers.clear()
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+def session_state(path: Path):
+    """ Storage state for a new context: the in-memory copy, else `path` when it exists. """
+    if _session_state is not None:
+        return _session_state
+    return path if path.exists() else None
+
+
+def remember_session_state(state: dict) -> bool:
+    """ Keep `state` for the next run's context; False when it equals the one already kept. """
+    global _session_state
+    if state == _session_state:
+        return False
+    _session_state = state
+    return True
+
+
+# ---------- Shared page helpers ---------------------------------------------------
+# used by both the lien and the real estate scraper
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet", "texttrack", "manifest"}
+# analytics / tag hosts: beacons and scripts that only cost round-trips on the scraping page
+BLOCKED_HOST_SUFFIXES = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googlesyndication.com",
+)
+# detail pages are only read for the inline viewer <script>; one compiled XPath over lxml's C parser
+VIEWER_SCRIPT_XPATH = etree.XPath("//script[contains(., 'ViewImage')]/text()")
+# viewer canvas fingerprint: "" until something non-white is painted, else size + sampled pixel sum
+VIEWER_CANVAS_SELECTOR = "div.vtm_imageClipper canvas"
+VIEWER_CANVAS_STATE_JS = """(sel) => {
+    const c = document.querySelector(sel);
+    if (!c || c.width < 100 || c.height < 100) return "";
+    let d;
+    try {
+        const w = Math.min(c.width, 64), h = Math.min(c.height, 64);
+        d = c.getContext("2d").getImageData((c.width - w) >> 1, (c.height - h) >> 1, w, h).data;
+    } catch (e) {
+        return c.width + "x" + c.height;  // tainted canvas, size is all we can read
+    }
+    let sum = 0, inked = false;
+    for (let i = 0; i < d.length; i += 4) {
+        sum += d[i] + d[i + 1] + d[i + 2];
+        if (d[i] < 250 || d[i + 1] < 250 || d[i + 2] < 250) inked = true;
+    }
+    return inked ? c.width + "x" + c.height + ":" + sum : "";
+}"""
+
+
+async def block_heavy_resources(route):
+    """ Route handler: abort images/fonts/media/CSS and analytics hosts on the scraping page. """
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or (urlsplit(request.url).hostname or "").endswith(BLOCKED_HOST_SUFFIXES)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def viewer_script_text(page_html: str) -> str | None:
+    """ Text of the inline <script> that opens the document viewer, if the page has one. """
+    try:
+        scripts = VIEWER_SCRIPT_XPATH(lxml.html.document_fromstring(page_html))
+    except (etree.ParserError, ValueError):
+        return None  # empty or non-HTML body
+    return str(scripts[0]) if scripts else None
+
+
+class ViewerPages:
+    """ One HTML5 viewer tab per worker tab, navigated per document instead of opened/closed. """
+
+    def __init__(self) -> None:
+        self._pages = {}
+
+    async def get(self, page):
+        """ The viewer tab paired with worker tab `page`, reused for every document it opens. """
+        viewer = self._pages.get(page)
+        if viewer is None or viewer.is_closed():
+            viewer = self._pages[page] = await page.context.new_page()
+        return viewer
+
+    async def close(self):
+        for viewer in self._pages.values():
+            try:
+                await viewer.close()
+            except pw.Error:
+                pass  # browser already closed by a stop request
+        self._pages.clear()
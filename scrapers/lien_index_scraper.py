@@ -1,28 +1,63 @@
 from __future__ import annotations
 
+import io
 import os
 import re
+import csv
 import html
 import json
+import bisect
+import hashlib
+import itertools
 import random
+import asyncio
+import zipfile
+import threading
 import traceback
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
+
+# Tesseract's own OpenMP threading oversubscribes cores when OCR calls already run in
+# parallel; must be set before tesseract is loaded or spawned.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 import cv2
 import img2pdf
 import numpy as np
 import pytesseract
 import pandas as pd
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from PIL import Image, ImageOps
+from PIL import Image
 from rich.console import Console
 import playwright.async_api as pw
-from openpyxl import Workbook, load_workbook
 
 from dashboard.utils.state import stop_scraper_flag 
+from scrapers.browser_pool import (
+    VIEWER_CANVAS_SELECTOR, VIEWER_CANVAS_STATE_JS, ViewerPages, acquire_browser,
+    block_heavy_resources, remember_session_state, session_state, viewer_script_text,
+)
+
+# optional in-process Tesseract binding; falls back to the pytesseract subprocess wrapper
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# optional JIT for the table-line removal kernel; falls back to OpenCV morphology
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# optional streaming xlsx writer for the final export; falls back to openpyxl
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 # Load environment variables
 load_dotenv()
@@ -45,11 +80,309 @@ UA_DICT = {
 
 UA = UA_DICT.get(os.getenv("OS_NAME"), "windows")
 EXTRA_HEADERS = {"Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8"}
+# lien detail pages processed at once, each in its own tab of the logged-in context
+LIEN_CONCURRENCY = max(1, int(os.getenv("LIEN_CONCURRENCY", "3")))
+OCR_MEMO_SIZE = 256  # page OCR results kept in memory in front of the ocr_cache/ directory
 
-TOTAL_LINE_REGEX = re.compile(r'(TOTAL\s*DUE|TOTALDUE)', re.I)
+TOTAL_LINE_REGEX = re.compile(r'TOTAL\s*DUE', re.I)  # \s* already covers "TOTALDUE"
 AMOUNT_PATTERN = re.compile(
     r'\$\s*([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?|[0-9]+(?:\.[0-9]+)?)'
 )
+# scraped field -> Excel header, in sheet order
+EXCEL_COLUMNS = {
+    "county": "County",
+    "direct_party_debtor": "Direct Party (Debtor)",
+    "reverse_party_claimant": "Reverse Party (Claimant)",
+    "ocr_address": "Address",
+    "zipcode": "Zipcode",
+    "ocr_total_due": "Total Due",
+    "instrument": "Instrument",
+    "date_filed": "Date Filed",
+    "book": "Book",
+    "page": "Page",
+    "ocr_description": "Description",
+    "pdf_document_url": "PDF Document URL",
+    "pdf_filename": "View PDF",
+}
+EXCEL_FIELDS = tuple(EXCEL_COLUMNS)
+EXCEL_HEADERS = list(EXCEL_COLUMNS.values())
+# address heuristics for extract_addresses_from_ocr
+CITY_STATE_ZIP_PATTERN = re.compile(r'([A-Za-z][A-Za-z0-9\.\'&\-\s]+,\s*[A-Za-z]{2}\s*(?P<zip>\d{5}))')
+ADDRESS_HEADER_PATTERN = re.compile(
+    r'\b(County|Tax|Commissioner|Recorded|Doc:|Rept#|VS\b|Defendant|GRANT|PAYMENT|TOTAL DUE|PHONE|TEL|Fax)\b', re.I
+)
+# a street line: leading house number, a street suffix, or any digit (the last subsumes the first)
+STREET_LINE_PATTERN = re.compile(
+    r'\d|\b(St(reet)?|Street|Rd(?!\w)|Road|Highway|HWY|Ave|Avenue|Blvd|Lane|Ln|Dr(?!\w)|Drive|Way|Court|Ct'
+    r'|Parkway|PKWY|Memorial|HW|WY|SW|NE|N\.E\.|S\.W\.)\b', re.I
+)
+ADDRESS_SKIP_PATTERN = re.compile(r'^\b(Grant|GORDON|GORDON COUNTY|SCOTT|LIEN|LIEN Bk|TOTAL|PAYMENT)\b', re.I)
+TOTAL_DUE_WHITELIST = "0123456789.,$ TOALDUE:"
+CURRENCY_PATTERN = re.compile(r'(?<!\d)(\d{1,3}(?:,\d{3})*(?:\.\d{2})|\d+\.\d{2})(?!\d)')
+
+LIEN_BASE_URL = "https://search.gsccca.org/Lien/"
+SUBMIT_FORM_PATTERN = re.compile(r"fnSubmitThisForm\('([^']+)'\)")
+RESULT_HREF_PATTERN = re.compile(r"""href=["'](javascript:fnSubmitThisForm\('[^']+'\))""")
+PAGE_COUNT_PATTERN = re.compile(r"Page\s+\d+\s+of\s+(\d+)", re.I)
+# detail-page sections found by their header cell text (document table is matched on its columns)
+LIEN_SECTION_LABELS = {
+    "description": "Description",
+    "direct_party_debtor": "Direct Party (Debtor)",
+    "reverse_party_claimant": "Reverse Party (Claimant)",
+}
+# all viewer vars in one scan of the <script> text
+VIEWER_SCRIPT_PATTERN = re.compile(
+    r'var iLienID\s*=\s*(?P<id>\d+);.*?var county\s*=\s*"(?P<county>\d+)".*?var book\s*=\s*"(?P<book>\d+)"'
+    r'.*?var page\s*=\s*"(?P<page>\d+)".*?var user\s*=\s*(?P<user>\d+).*?var appid\s*=\s*(?P<appid>\d+)',
+    re.S,
+)
+VIEWER_URL_TEMPLATE = (
+    "https://search.gsccca.org/Imaging/HTML5Viewer.aspx?"
+    "id={lien_id}&key1={book}&key2={page_num}&county={county}&userid={userid}&appid={appid}"
+)
+
+# ---------- directories ---------------------------------------------------------
+# resolved and created once at import instead of on every scraper construction
+BASE_OUTPUT_DIR = Path(__file__).resolve().parent.parent / "output"
+LIEN_OUTPUT_DIR = BASE_OUTPUT_DIR / "lien"
+OCR_CACHE_DIR = LIEN_OUTPUT_DIR / "ocr_cache"
+RESUME_STATE_PATH = LIEN_OUTPUT_DIR / "lien_resume_state.json"
+OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# ---------- kernels -----------------------------------------------------------
+@lru_cache(maxsize=16)
+def _rect_kernel(width: int, height: int) -> np.ndarray:
+    """ Cached MORPH_RECT element; page sizes (and so line lengths) repeat across a batch. """
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (width, height))
+
+
+# Tesseract's LSTM is trained on ~300dpi text; glyphs taller than this are downsampled to it
+TARGET_GLYPH_HEIGHT = 30
+
+# OpenCV T-API: without numba, preprocess_page keeps its chain in UMat space on an OpenCL device
+OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _strip_lines(bw_inv, h_len, v_len, out, invert):
+        """
+        Fused equivalent of OpenCV MORPH_OPEN with 1xh_len / v_lenx1 rects, OR, AND-NOT.
+        Expects a binary (0/255) image; openings are done with prefix counts, O(h*w).
+        With invert=True the final bitwise_not is applied in the same write (black text on white).
+        """
+        h, w = bw_inv.shape
+        h_anchor = h_len // 2
+        v_anchor = v_len // 2
+
+        # pass 1: horizontal opening per row, write bw_inv minus horizontal lines
+        for y in prange(h):
+            bg = np.zeros(w + 1, np.int32)
+            for x in range(w):
+                bg[x + 1] = bg[x] + (1 if bw_inv[y, x] == 0 else 0)
+            ero = np.zeros(w + 1, np.int32)
+            for x in range(w):
+                lo = max(0, x - h_anchor)
+                hi = min(w, x - h_anchor + h_len)
+                ero[x + 1] = ero[x] + (1 if bg[hi] - bg[lo] == 0 else 0)
+            for x in range(w):
+                lo = max(0, x - h_anchor)
+                hi = min(w, x - h_anchor + h_len)
+                out[y, x] = 0 if ero[hi] - ero[lo] > 0 else bw_inv[y, x]
+
+        # pass 2: vertical opening per column, clear vertical lines in out
+        for x in prange(w):
+            bg = np.zeros(h + 1, np.int32)
+            for y in range(h):
+                bg[y + 1] = bg[y] + (1 if bw_inv[y, x] == 0 else 0)
+            ero = np.zeros(h + 1, np.int32)
+            for y in range(h):
+                lo = max(0, y - v_anchor)
+                hi = min(h, y - v_anchor + v_len)
+                ero[y + 1] = ero[y] + (1 if bg[hi] - bg[lo] == 0 else 0)
+            for y in range(h):
+                lo = max(0, y - v_anchor)
+                hi = min(h, y - v_anchor + v_len)
+                v = 0 if ero[hi] - ero[lo] > 0 else out[y, x]
+                out[y, x] = 255 - v if invert else v
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _mean_threshold_inv(gray, ii, block_size, c, out):
+        """
+        Bradley-style mean threshold from an integral image, inverted (ink = 255).
+        Four lookups per pixel, cost independent of block_size; window is clipped at the borders.
+        """
+        h, w = gray.shape
+        r = block_size // 2
+        for y in prange(h):
+            y0 = max(0, y - r)
+            y1 = min(h, y + r + 1)
+            for x in range(w):
+                x0 = max(0, x - r)
+                x1 = min(w, x + r + 1)
+                total = ii[y1, x1] - ii[y0, x1] - ii[y1, x0] + ii[y0, x0]
+                mean = total / ((y1 - y0) * (x1 - x0))
+                out[y, x] = 255 if gray[y, x] <= mean - c else 0
+else:
+    _strip_lines = None
+    _mean_threshold_inv = None
+
+
+# bit-packed (SWAR) table-line removal for when numba is missing: each uint64 holds 64 pixels
+# of a row, so a run test is log2(len) shift+AND passes over 1/8 of the bytes
+_ONES64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+_ZERO64 = np.uint64(0)
+
+
+def _pack_rows(bits: np.ndarray) -> np.ndarray:
+    """ Bool rows (width a multiple of 64) -> uint64 words, leftmost pixel in the top bit. """
+    return np.packbits(bits, axis=1).view(">u8").astype(np.uint64)
+
+
+def _shift_cols(words: np.ndarray, d: int, fill) -> np.ndarray:
+    """ Packed rows shifted so pixel x takes pixel x + d; `fill` past the ends. """
+    q, r = divmod(abs(d), 64)
+    h, n = words.shape
+    ext = np.full((h, n + q + 1), fill, np.uint64)
+    r, rr = np.uint64(r), np.uint64(64 - r)
+    if d > 0:
+        ext[:, :n] = words
+        src, nxt = ext[:, q:q + n], ext[:, q + 1:q + 1 + n]
+        return (src << r) | (nxt >> rr) if r else src.copy()
+    ext[:, q + 1:] = words
+    src, prv = ext[:, 1:1 + n], ext[:, :n]
+    return (src >> r) | (prv << rr) if r else src.copy()
+
+
+def _shift_rows(words: np.ndarray, d: int, fill) -> np.ndarray:
+    """ Row y takes row y + d; `fill` past the ends. """
+    out = np.full_like(words, fill)
+    if d > 0:
+        out[:-d] = words[d:]
+    else:
+        out[-d:] = words[:d or None]
+    return out
+
+
+def _run_reduce(words: np.ndarray, length: int, anchor: int, fill, op, axis: int) -> np.ndarray:
+    """
+    `op` over the `length` pixels starting `anchor` before each pixel along `axis`, i.e. a
+    cv2 1-D rect erode (bitwise_and, fill ones) or dilate (bitwise_or, fill zeros).
+    """
+    unit = 1 if axis == 0 else 64
+    lo, hi = -(-anchor // unit), -(-length // unit)  # room for the window past either edge
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (lo, hi)
+    acc = np.pad(words, pad, constant_values=fill)
+    shift = _shift_rows if axis == 0 else _shift_cols
+    if anchor:
+        acc = shift(acc, -anchor, fill)
+    k = 1
+    while k * 2 <= length:
+        acc = op(acc, shift(acc, k, fill))
+        k *= 2
+    if length > k:
+        acc = op(acc, shift(acc, length - k, fill))
+    return acc[lo:acc.shape[0] - hi] if axis == 0 else acc[:, lo:acc.shape[1] - hi]
+
+
+def _strip_lines_packed(bw_inv: np.ndarray, h_len: int, v_len: int) -> np.ndarray:
+    """ Same result as the cv2 MORPH_OPEN / OR / AND-NOT chain in remove_table_lines. """
+    h, w = bw_inv.shape
+    pad = -w % 64
+    words = _pack_rows(np.pad(bw_inv > 0, ((0, 0), (0, pad))))
+    inside = _pack_rows(np.arange(w + pad)[None, :] < w)
+    lines = _ZERO64
+    # cv2 erodes as if the outside were ink and dilates as if it were background
+    for length, axis, outside in ((h_len, 1, ~inside), (v_len, 0, _ZERO64)):
+        anchor = length // 2
+        ero = _run_reduce(words | outside, length, anchor, _ONES64, np.bitwise_and, axis) & inside
+        lines = lines | _run_reduce(ero, length, anchor, _ZERO64, np.bitwise_or, axis)
+    clean = np.unpackbits((words & ~lines).astype(">u8").view(np.uint8), axis=1)[:, :w]
+    return clean * np.uint8(255)
+
+
+# ---------- xlsx export --------------------------------------------------------
+# the results sheet is a fixed set of text columns plus one link, so the fallback writer emits
+# the SpreadsheetML parts itself instead of building openpyxl cell objects
+XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/'
+        'relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+# control characters are not allowed in XML 1.0 text
+XML_ILLEGAL_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _xml_text(value: str) -> str:
+    return escape(XML_ILLEGAL_PATTERN.sub("", value))
+
+
+def _write_xlsx_fast(path: str, headers: list, rows, pdf_col: int, pdf_base: str) -> int:
+    """
+    Write a one-sheet xlsx of inline strings, with a HYPERLINK formula in `pdf_col`.
+    `rows` yields tuples of str in `headers` order; returns the number of data rows.
+    """
+    cols = [chr(ord("A") + c) for c in range(len(headers))]  # the lien sheet stays within A-Z
+    count = 0
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, xml in XLSX_STATIC_PARTS.items():
+            zf.writestr(name, xml)
+        with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            for r, values in enumerate(itertools.chain([headers], rows), 1):
+                cells = []
+                for c, value in enumerate(values):
+                    if not value:
+                        continue
+                    ref = f"{cols[c]}{r}"
+                    if c == pdf_col and r > 1 and value.strip():
+                        text = _xml_text(value)
+                        link = _xml_text(pdf_base + value).replace('"', "&quot;&quot;")
+                        name = text.replace('"', "&quot;&quot;")
+                        cells.append(
+                            f'<c r="{ref}" t="str"><f>HYPERLINK(&quot;{link}&quot;,&quot;{name}&quot;)</f>'
+                            f'<v>{text}</v></c>'
+                        )
+                    else:
+                        cells.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{_xml_text(value)}</t></is></c>')
+                sheet.write(f'<row r="{r}">{"".join(cells)}</row>'.encode("utf-8"))
+                count += 1
+            sheet.write(b"</sheetData></worksheet>")
+    return count - 1  # header row
 
 
 # load Tesseract path for Windows if needed
@@ -66,8 +399,8 @@ class LienIndexScraper:
 
     def __init__(self) -> None:
         try:
-            self.playwright = None
             self.browser = None
+            self.context = None
             self.page = None
             self.email = TAX_EMAIL
             self.password = TAX_PASSWORD
@@ -77,15 +410,33 @@ class LienIndexScraper:
             self.homepage = "https://www.gsccca.org/"
             self.login_url = "https://apps.gsccca.org/login.asp"
             self.name_search_url = "https://search.gsccca.org/Lien/namesearch.asp"
-            self.results = []
+            # per-row CSV log, turned into the session workbook by save_to_excel
+            self._rows_file = None
+            self._rows_writer = None
+            # URL-list status writes run in a thread, at most one at a time (see _save_url_status)
+            self._status_lock = asyncio.Lock()
+            self._status_dirty = False
+            # worker tab -> its HTML5 viewer tab, navigated per document instead of opened/closed
+            self._viewer_pages = ViewerPages()
+            # set once the site announcement is dismissed; the choice sticks for the session
+            self._banner_handled = asyncio.Event()
+            # in-memory front of the on-disk OCR cache: the same document listed under several
+            # names renders the same page image within one run
+            self._ocr_memo = {}
+            # one tesserocr API per pool thread (PyTessBaseAPI is not thread-safe)
+            self._tess_local = threading.local()
+            self._tess_apis = []
+            # Tesseract releases the GIL, so OCR runs in threads off the event loop
+            self._ocr_pool = ThreadPoolExecutor(
+                max_workers=max(2, (os.cpu_count() or 2) // 2), initializer=self._warm_ocr_worker
+            )
             
             self.excel_path = ""
-            script_dir = Path(__file__).parent.absolute()
             self.county_folder_path = ""
-            self.base_output_dir = os.path.join(script_dir.parent, "output") 
-            self.lien_output_dir = os.path.join(self.base_output_dir, "lien")
-            os.makedirs(self.lien_output_dir, exist_ok=True)
-            self.resume_state_path = os.path.join(self.lien_output_dir, "lien_resume_state.json")
+            self.base_output_dir = BASE_OUTPUT_DIR
+            self.lien_output_dir = LIEN_OUTPUT_DIR
+            self.resume_state_path = RESUME_STATE_PATH
+            self.ocr_cache_dir = OCR_CACHE_DIR
             
             console.print(f"[green]Lien Output directory --> {self.lien_output_dir}[/green]")
         except Exception as e:
@@ -93,7 +444,8 @@ class LienIndexScraper:
             raise
     
 
-    def time_sleep(self, a: int = 3000, b: int = 5000) -> int:
+    @staticmethod
+    def time_sleep(a: int = 3000, b: int = 5000) -> float:
         return random.uniform(a, b)
     
     
@@ -115,14 +467,15 @@ class LienIndexScraper:
         state = {
             "csv_path": self.csv_path,
             "county_folder_path": self.county_folder_path,
+            "excel_path": self.excel_path,
         }
-        os.makedirs(os.path.dirname(self.resume_state_path), exist_ok=True)
+        self.resume_state_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.resume_state_path, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2)
 
 
     def _load_resume_state(self):
-        if not os.path.exists(self.resume_state_path):
+        if not self.resume_state_path.exists():
             return None
         with open(self.resume_state_path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -155,56 +508,26 @@ class LienIndexScraper:
         return v
 
 
-    async def _append_result_to_excel(self, data: dict):
-        """Append ONE row to an Excel file, safely (atomic write)."""
-        excel_path = await self._get_session_excel_path()
-
-        columns = {
-            "county": "County",
-            "direct_party_debtor": "Direct Party (Debtor)",
-            "reverse_party_claimant": "Reverse Party (Claimant)",
-            "ocr_address": "Address",
-            "zipcode": "Zipcode",
-            "ocr_total_due": "Total Due",
-            "instrument": "Instrument",
-            "date_filed": "Date Filed",
-            "book": "Book",
-            "page": "Page",
-            "ocr_description": "Description",
-            "pdf_document_url": "PDF Document URL",
-            "pdf_filename": "View PDF",
-        }
-
-        headers = list(columns.values())
-
-        # build row in the same display order as headers
-        row_vals = []
-        for data_col, xl_col in columns.items():
-            if xl_col == "View PDF":
-                pdf_name = data.get("pdf_filename", "")
-                if isinstance(pdf_name, str) and pdf_name.strip():
-                    view_path = os.path.join(self.documents_dir, pdf_name).replace(os.sep, "/")
-                    row_vals.append(f'=HYPERLINK("file:///{view_path}", "{pdf_name}")')
-                else:
-                    row_vals.append("")
-            else:
-                row_vals.append(self._excel_safe(data.get(data_col, "")))
+    def _rows_path(self) -> str:
+        """ Row log that backs the session workbook until save_to_excel builds it. """
+        return os.path.splitext(self.excel_path)[0] + "_rows.csv"
 
 
-        if os.path.exists(excel_path):
-            wb = load_workbook(excel_path)
-            ws = wb.active
-        else:
-            wb = Workbook()
-            ws = wb.active
-            ws.append(headers)
-
-        ws.append(row_vals)
+    async def _append_result_to_excel(self, data: dict):
+        """Append ONE row to the session's row log (CSV, flushed per row; xlsx built at the end)."""
+        excel_path = await self._get_session_excel_path()
 
-        # atomic save to avoid corruption if crash during save
-        tmp_path = excel_path + ".tmp"
-        wb.save(tmp_path)
-        os.replace(tmp_path, excel_path)
+        if self._rows_file is None:
+            rows_path = self._rows_path()
+            is_new = not os.path.exists(rows_path)
+            self._rows_file = open(rows_path, "a", newline="", encoding="utf-8")
+            self._rows_writer = csv.writer(self._rows_file)
+            if is_new:
+                self._rows_writer.writerow(EXCEL_HEADERS)
+            self._save_resume_state()  # a resumed run keeps appending to the same workbook
+
+        self._rows_writer.writerow(self._excel_safe(data.get(col, "")) for col in EXCEL_FIELDS)
+        self._rows_file.flush()
         console.print(f"[bold green]Saved record to --> {excel_path}[/bold green]")
 
         
@@ -212,10 +535,8 @@ class LienIndexScraper:
         """ Global stop flag to immediately exit scraping if invoked by user. """
         if stop_scraper_flag['lien']:
             console.print("[yellow]Lien Index Scraper received immediate stop signal. Exiting...[/yellow]")
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            # only this run's context: the shared browser may be serving another scraper
+            await self._close_context()
             raise pw.Error("STOP_REQUESTED")
 
 
@@ -223,7 +544,10 @@ class LienIndexScraper:
         """Save cookies + storage ONLY for login check."""
         try:
             state = await self.page.context.storage_state()
-            Path(out_file).write_text(json.dumps(state, indent=2))
+            # compared against the process-wide copy, so an unchanged login across runs skips the write
+            if not remember_session_state(state):
+                return
+            Path(out_file).write_text(json.dumps(state, separators=(",", ":")))
             print(f"Saved login state to --> {out_file}")
         except Exception as e:
             console.print(f"[red]Failed to dump cookies: {e}[/red]")
@@ -232,11 +556,13 @@ class LienIndexScraper:
     async def already_logged_in(self) -> bool:
         """Check if user is already logged in."""
         try:
-            await self.page.wait_for_timeout(self.time_sleep())
-            all_text = await self.page.evaluate("document.body.innerText")
-            if "logout" in all_text.lower():
-                return True
-            return False
+            # probe for the logout link instead of pulling the whole page text over CDP
+            logout_link = self.page.locator("a[href*='logout' i], a:has-text('Logout')")
+            try:
+                await logout_link.first.wait_for(state="attached", timeout=3000)
+            except pw.TimeoutError:
+                return False
+            return True
 
         except Exception as e:
             print(f"[already_logged_in ERROR] {e}")
@@ -257,15 +583,19 @@ class LienIndexScraper:
             return False
         
         
-    async def check_and_handle_announcement(self):
+    async def check_and_handle_announcement(self, page=None):
         """Check if announcement page loaded; if yes, redirect to name_search_url."""
+        if self._banner_handled.is_set():
+            return
+        page = page or self.page
         try:
-            current_url = self.page.url
+            current_url = page.url
             if "Announcement" in current_url:
-                await self.page.select_option("#Options", "dismiss")
-                await self.page.wait_for_timeout(1000)
-                await self.page.click("input[name='Continue']")
+                await page.select_option("#Options", "dismiss")
+                await page.wait_for_timeout(1000)
+                await page.click("input[name='Continue']")
                 print("Announcement page detected. Turning off...")
+                self._banner_handled.set()
         except Exception as e:
             console.print(f"[red]Error handling announcement: {e}[/red]")
             
@@ -274,15 +604,11 @@ class LienIndexScraper:
         """Perform login and save cookies."""
         try:
             await self.page.goto(self.login_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
 
             await self.page.fill("input[name='txtUserID']", self.email)
-            await self.page.wait_for_timeout(self.time_sleep()) 
             await self.page.fill("input[name='txtPassword']", self.password)
-            await self.page.wait_for_timeout(self.time_sleep())
             checkbox = await self.page.query_selector("input[type='checkbox'][name='permanent']")
-            await self.page.wait_for_timeout(self.time_sleep(a=1000, b=1200))
             
             if checkbox:
                 is_checked = await checkbox.is_checked()
@@ -298,11 +624,9 @@ class LienIndexScraper:
                 await self.page.evaluate("document.forms['frmLogin'].submit()")
 
             await self.page.wait_for_load_state("networkidle", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
             
             await self.page.goto(self.name_search_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
             
             if await self.already_logged_in():
@@ -322,38 +646,28 @@ class LienIndexScraper:
         try:
             print("Executing Name Search...")
             await self.page.goto(self.name_search_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
         except Exception as e:
             console.print(f"[red]Error in start_search: {e}[/red]")
 
         try:
             await self.page.select_option("#txtPartyType", self.form_data.get("party_type"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='txtInstrCode']", self.form_data.get("instrument_type"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='intCountyID']", self.form_data.get("county"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
 
             include_val = self.form_data.get("include_counties")
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             checkbox_selector = f"input[name='bolInclude'][value='{include_val}']"
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             if await self.page.query_selector(checkbox_selector):
                 await self.page.check(checkbox_selector)
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
 
             await self.page.fill("input[name='txtSearchName']", self.form_data.get("search_name"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.fill("input[name='txtFromDate']", self.form_data.get("from_date"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.fill("input[name='txtToDate']", self.form_data.get("to_date"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='MaxRows']", self.form_data.get("max_rows", "100"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='TableType']", self.form_data.get("table_type", "1"))
 
-            await self.page.wait_for_timeout(self.time_sleep())
+            # one short human-like pause before submitting; the form itself needs no waits
+            await self.page.wait_for_timeout(self.time_sleep(a=200, b=500))
             await self.page.locator('input[type="button"][value="Search"]').click()
         except Exception as e:
             print(f"[ERROR] start_search: {e}\n{traceback.format_exc()}")
@@ -362,9 +676,9 @@ class LienIndexScraper:
     async def get_search_results(self):
         """Process ALL rows with Occurs values."""
         print(f"Conducting Lien Search...")
+        csv_file = None
         try:
             await self.page.wait_for_selector("table.name_results", state="visible", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             
             name_strongs = await self.page.locator(
                 "//td[normalize-space()='Name Searched:']/following-sibling::td//strong"
@@ -377,51 +691,78 @@ class LienIndexScraper:
             all_values = searched_strongs + name_strongs
             self.county_folder = "_".join([t.strip().lower().replace(" ", "_") for t in all_values])
             
-            self.county_folder_path = os.path.join(self.lien_output_dir, self.county_folder)
-            self.documents_dir = os.path.join(self.county_folder_path, "documents") 
-            os.makedirs(self.county_folder_path, exist_ok=True)
-            os.makedirs(self.documents_dir, exist_ok=True)
+            self.documents_dir = self.lien_output_dir / self.county_folder / "documents"
+            self.documents_dir.mkdir(parents=True, exist_ok=True)
+            # kept as str: it is written to the resume state JSON
+            self.county_folder_path = str(self.documents_dir.parent)
             
-            # Get total number of rows initially
-            rows = await self.page.query_selector_all("table.name_results tr")
-            total_rows = len(rows) - 1  # Exclude header
+            # Read every row's Occurs text and radio id in one round-trip (header excluded)
+            rows_data = await self.page.eval_on_selector_all(
+                "table.name_results tr",
+                """els => els.slice(1).map(r => {
+                    const radio = r.querySelector("input[type='radio']");
+                    return {
+                        occurs: r.cells[1] ? r.cells[1].innerText.trim() : "",
+                        hasRadio: !!radio,
+                        radioId: radio && radio.id ? radio.id : null,
+                    };
+                })"""
+            )
+            total_rows = len(rows_data)
             
             print(f"Found {total_rows} rows to process...")
 
-            # to collect all results URLs
-            results_df = pd.DataFrame(columns=['url', 'status'])
+            # stream all results URLs straight to CSV
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            search_name = re.sub(r'[^a-zA-Z0-9]', '', self.form_data.get("search_name", "")).replace(" ", "_")
+            self.csv_path = os.path.join(self.county_folder_path, f"{search_name}_urls_list_{timestamp}.csv")
+            csv_file = open(self.csv_path, "w", newline="", encoding="utf-8")
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(["url", "status"])
             
+            # hoisted once: locators re-resolve in the page on each use, so they survive the
+            # details/back navigation without a re-query (and never go stale)
+            result_rows = self.page.locator("table.name_results tr")
+            display_details = self.page.locator("input[value='Display Details']").first
+            back_button = self.page.locator("input[name='bBack']").first
+            next_page_link = self.page.locator(
+                "a[href*='liennamesselected.asp?page=']:has-text('Next'), a:has-text('Next Page')"
+            ).first
+
             for row_index in range(total_rows):
                 await self.stop_check()
                 print("*" * 50)
                 print(f"Exracting URLs from Row {row_index + 1} of {total_rows}")
                     
                 try:
-                    await self.page.wait_for_selector("table.name_results", timeout=15000)
-                    rows = await self.page.query_selector_all("table.name_results tr")
-                    
-                    if row_index + 1 >= len(rows):
-                        print(f"[WARNING] Row index {row_index + 1} not found, skipping")
-                        continue
-                        
-                    current_row = rows[row_index + 1]  # Skip header
-                    cols = await current_row.query_selector_all("td")
-
+                    # the results table was awaited on entry and after each row's recovery below
                     # Get Occurs value and radio button
-                    occurs_text = await cols[1].inner_text()
-                    radio = await cols[0].query_selector("input[type='radio']")
+                    row_data = rows_data[row_index]
+                    occurs_text = row_data["occurs"]
+                    if row_data["radioId"]:
+                        radio = self.page.locator(f"#{row_data['radioId']}")
+                    else:
+                        radio = (
+                            result_rows
+                            .nth(row_index + 1)  # Skip header
+                            .locator("input[type='radio']")
+                        )
                     
                     try:
-                        if not radio:
+                        if not row_data["hasRadio"]:
                             print(f"[WARNING] No radio button found for row {row_index + 1}, skipping")
                             continue
+                        # the snapshot already says which names have no documents: no details/back
+                        # round trip (and no 15s wait for links that never come) for those
+                        if occurs_text.replace(",", "").isdigit() and int(occurs_text.replace(",", "")) == 0:
+                            print(f"Row {row_index + 1} has no occurrences, skipping")
+                            continue
                             
                         # Click the radio button with retry
                         retries = 3
                         for attempt in range(retries):
                             try:
                                 await radio.click()
-                                await self.page.wait_for_timeout(500)
                                 break
                             except Exception as click_error:
                                 if attempt == retries - 1:
@@ -430,79 +771,63 @@ class LienIndexScraper:
                                 await self.page.wait_for_timeout(1000)
                         
                         # Click "Display Details"
-                        display_btn = await self.page.query_selector("input[value='Display Details']")
-                        if not display_btn:
+                        if not await display_details.count():
                             print(f"[ERROR] 'Display Details' button not found for row {row_index + 1}")
                             continue
                             
-                        await display_btn.click()
+                        await display_details.click()
                         next_page_found = True
                         next_page = 1
                         while next_page_found:
                             print(f"Extracting Page {next_page} results...")
-                            await self.page.wait_for_selector('a[href^="javascript:fnSubmitThisForm("]', timeout=15000)
-                            await self.page.wait_for_timeout(self.time_sleep())
-                            await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                            await self.page.wait_for_timeout(self.time_sleep())
+                            # the links are server-rendered: once the first is attached, all are
+                            await self.page.wait_for_selector(
+                                'a[href^="javascript:fnSubmitThisForm("]', state="attached", timeout=15000
+                            )
 
                             # grab all matching hrefs in one shot (fast)
                             hrefs = await self.page.eval_on_selector_all(
                                 'a[href^="javascript:fnSubmitThisForm("]',
                                 'els => els.map(e => e.getAttribute("href"))'
                             )
-
-                            # extract the relative path inside the JS call and build full URLs
-                            pattern = re.compile(r"fnSubmitThisForm\('([^']+)'\)")
-                            base = "https://search.gsccca.org/Lien/"
-                            urls = []
-
-                            for h in hrefs:
-                                if not h:
-                                    continue
-                                m = pattern.search(h)
-                                if not m:
-                                    continue
-                                rel = html.unescape(m.group(1))
-                                full = urljoin(base, rel)
-                                urls.append(full)
-
-                            # append to your DataFrame
-                            if urls:
-                                results_df = pd.concat([results_df, pd.DataFrame({'url': urls, 'status': ''})], ignore_index=True)
-                            results_url = results_df
+                            urls = self._result_urls_from_hrefs(hrefs)
+
+                            # remaining pages are fetched over HTTP in parallel, no clicking through
+                            fetched_all_pages = False
+                            if next_page == 1:
+                                page_count = self._parse_page_count(await self.page.content())
+                                if page_count > 1:
+                                    print(f"Fetching pages 2-{page_count} in parallel...")
+                                    page_urls = await self._fetch_result_pages(page_count)
+                                    if page_urls is not None:
+                                        urls.extend(page_urls)
+                                        fetched_all_pages = True
+                                    else:
+                                        console.print("[yellow]Falling back to paging through the results...[/yellow]")
+
+                            # append to CSV, dropping pager links
+                            csv_writer.writerows([u, ""] for u in urls if "maxrows" not in u.lower())
+                            csv_file.flush()
                             # if len(results_url) >= 20:
                             #     break
+                            if fetched_all_pages:
+                                break
                             
-                            next_selectors = [
-                                "a[href*='liennamesselected.asp?page=']:has-text('Next Page')",
-                                "font a[href*='liennamesselected.asp?page=']",
-                                "a:has-text('Next Page')",
-                                "font:has-text('Next Page') a",
-                                "a:has-text('Next')"
-                            ]
-
-                            for selector in next_selectors:
-                                next_page_link = await self.page.query_selector(selector)
-
-                            if next_page_link:
-                                next_page += 1
-                                
+                            next_page_found = False
+                            if await next_page_link.count():
                                 # Get the href for recovery
                                 next_href = await next_page_link.get_attribute("href")
                                 if next_href:
-                                    await next_page_link.click()     
-                                    next_page_found = True      
-                            else:
-                                next_page_found = False             
+                                    next_page += 1
+                                    await next_page_link.click()
+                                    next_page_found = True
                         
                         # if len(results_url) >= 20:
                         #     break
                         
                         back_success = False
                         for i in range(next_page):
-                            await self.page.wait_for_timeout(self.time_sleep())
-                            back_button = await self.page.query_selector("input[name='bBack']")
-                            if back_button:
+                            if await back_button.count():
                                 try:
                                     await back_button.click()
                                     await self.page.wait_for_load_state("domcontentloaded", timeout=15000)
@@ -536,19 +861,79 @@ class LienIndexScraper:
                 except Exception as e:
                     print(f"[ERROR] Failed to process row {row_index + 1}: {e}\n{traceback.format_exc()}")
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            results_url = results_df[~results_df['url'].str.contains('maxrows', case=False, na=False)]
-            search_name = re.sub(r'[^a-zA-Z0-9]', '', self.form_data.get("search_name", "")).replace(" ", "_")
-            self.csv_path = os.path.join(self.county_folder_path, f"{search_name}_urls_list_{timestamp}.csv")
-            results_url.to_csv(self.csv_path, index=False)
+            csv_file.close()
             self._save_resume_state()
             print(f"Success -> Search results' URLs saved to CSV at {self.csv_path}")
 
         except Exception as e:
             console.print(f"[red]Error in get_search_results: {e}[/red]")
             traceback.format_exc()
+        finally:
+            if csv_file:
+                csv_file.close()
             
 
+    def _result_urls_from_hrefs(self, hrefs) -> list[str]:
+        """ Build full detail URLs from `javascript:fnSubmitThisForm('...')` hrefs. """
+        urls = []
+        for h in hrefs:
+            if not h:
+                continue
+            m = SUBMIT_FORM_PATTERN.search(h)
+            if not m:
+                continue
+            rel = html.unescape(m.group(1))
+            urls.append(urljoin(LIEN_BASE_URL, rel))
+        return urls
+
+
+    def _parse_page_count(self, page_html: str) -> int:
+        """ Read total page count from the 'Page X of Y' pager, 1 if absent. """
+        m = PAGE_COUNT_PATTERN.search(page_html or "")
+        return int(m.group(1)) if m else 1
+
+
+    async def _fetch_result_page(self, url: str) -> list[str]:
+        """ Fetch one result page and return its detail URLs; raises if it is not a results page. """
+        retries = 2
+        for attempt in range(retries):
+            try:
+                response = await self.page.context.request.get(url, timeout=30000)
+                if not response.ok:
+                    raise RuntimeError(f"HTTP {response.status}")
+                hrefs = RESULT_HREF_PATTERN.findall(await response.text())
+                if not hrefs:
+                    # an expired session or error page comes back as 200 without any result links
+                    raise RuntimeError(f"no result links on {response.url}")
+                return self._result_urls_from_hrefs(hrefs)
+            except Exception as e:
+                if attempt == retries - 1:
+                    raise
+                print(f"[RETRY] Result page fetch failed ({e}), attempt {attempt + 1}/{retries}")
+
+
+    async def _fetch_result_pages(self, page_count: int) -> list[str] | None:
+        """
+        Fetch result pages 2..page_count concurrently and harvest their detail URLs.
+        Returns None if any page failed, so the caller clicks through the pages instead.
+        """
+        page_numbers = range(2, page_count + 1)
+        results = await asyncio.gather(
+            *[self._fetch_result_page(f"{LIEN_BASE_URL}liennamesselected.asp?page={i}") for i in page_numbers],
+            return_exceptions=True,
+        )
+
+        urls = []
+        failed = False
+        for page_number, result in zip(page_numbers, results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Result page {page_number} fetch failed: {result}[/yellow]")
+                failed = True
+            else:
+                urls.extend(result)
+        return None if failed else urls
+
+
     async def process_result_urls(self):
         """Step 5: Process all RP buttons, extract data and save with improved reliability"""
         result_urls = pd.read_csv(self.csv_path)
@@ -558,109 +943,143 @@ class LienIndexScraper:
 
         print(f"Initiating lien data extraction...\nTotal URLs count: {len(result_urls)}")
 
+        queue = asyncio.Queue()
+        for index, row in result_urls.iterrows():
+            if str(row.get("status", "")).strip().lower() != "done":
+                queue.put_nowait((index, row["url"]))
+
+        # tabs produce screenshots, OCR consumers finish them; the bound keeps PNGs in check
+        ocr_queue = asyncio.Queue(maxsize=2 * LIEN_CONCURRENCY)
+
+        async def worker(page):
+            while not queue.empty():
+                index, url = queue.get_nowait()
+                await self._process_result_url(page, index, url, result_urls, ocr_queue)
+
+        # a few tabs share the logged-in context; the main page is the first of them
+        pages = [self.page]
+        workers = []
+        consumers = []
         try:
-            for index, row in result_urls.iterrows():
-                if str(row.get("status", "")).strip().lower() == "done":
-                    continue
+            for _ in range(min(LIEN_CONCURRENCY, queue.qsize()) - 1):
+                extra = await self.page.context.new_page()
+                await extra.route("**/*", block_heavy_resources)
+                pages.append(extra)
+            consumers = [
+                asyncio.create_task(self._ocr_consumer(ocr_queue, result_urls)) for _ in pages
+            ]
+            workers = [asyncio.create_task(worker(page)) for page in pages]
+            await asyncio.gather(*workers)
+            await ocr_queue.join()
+            for task in consumers:
+                task.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
 
-                # if index == 20:
-                #     break
-                
-                await self.stop_check()
-                print("-" * 50)
-                print(f"{index + 1}. URL: ", row['url'])
-                
-                await self.page.goto(row['url'], wait_until="domcontentloaded", timeout=60000)
-                if await self.page.locator("body:has-text('CANCELLATION')").count() > 0:
-                    print(f"⚠️ 'CANCELLATION' found on page. Skipping: {row['url']}")
-                    result_urls.at[index, "status"] = "Done"
-                    result_urls.to_csv(self.csv_path, index=False)
-                    continue
-                await self.check_and_handle_announcement()
-                await self.page.wait_for_timeout(self.time_sleep())
-
-                # Parse data
-                data = await self.parse_lien_data()
+        except Exception as e:
+            for task in workers + consumers:
+                task.cancel()
+            await asyncio.gather(*workers, *consumers, return_exceptions=True)
+            console.print(f"[red]Error in process_result_urls: {e}[/red]")
+            traceback.format_exc()
+        finally:
+            for extra in pages[1:]:
+                try:
+                    await extra.close()
+                except pw.Error:
+                    pass  # browser already closed by a stop request
+            await self._viewer_pages.close()
+
+
+    async def _process_result_url(self, page, index, url, result_urls: pd.DataFrame, ocr_queue: asyncio.Queue):
+        """ Open one result URL in `page`, parse it and queue it for OCR and saving. """
+        # if index == 20:
+        #     return
+
+        await self.stop_check()
+        print("-" * 50)
+        print(f"{index + 1}. URL: ", url)
+
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        if await page.locator("body:has-text('CANCELLATION')").count() > 0:
+            print(f"⚠️ 'CANCELLATION' found on page. Skipping: {url}")
+            result_urls.at[index, "status"] = "Done"
+            await self._save_url_status(result_urls)
+            return
+        await self.check_and_handle_announcement(page)
+        # the detail HTML as served; skips re-serializing the DOM unless an announcement intervened
+        page_html = None
+        if response is not None and response.ok and "Announcement" not in page.url:
+            page_html = await response.text()
+
+        # Parse data; PDF/OCR and saving continue in an OCR consumer while this tab moves on
+        data, page_job = await self.parse_lien_data(page, page_html)
+        await ocr_queue.put((index, data, page_job))
+
+
+    async def _save_url_status(self, df: pd.DataFrame):
+        """ Rewrite the URL list CSV in a thread; marks made while a write is running are folded
+        into one follow-up write instead of each rewriting the file. """
+        self._status_dirty = True
+        if self._status_lock.locked():
+            return  # the running writer picks this change up
+        async with self._status_lock:
+            while self._status_dirty:
+                self._status_dirty = False
+                # snapshot on the loop, so the thread never reads a frame other tabs are marking
+                snapshot = df.copy()
+                await asyncio.to_thread(snapshot.to_csv, self.csv_path, index=False)
+
+
+    async def _ocr_consumer(self, ocr_queue: asyncio.Queue, result_urls: pd.DataFrame):
+        """ Finish queued records (PDF + OCR), save them, then mark them Done in the CSV. """
+        while True:
+            index, data, page_job = await ocr_queue.get()
+            try:
+                if page_job:
+                    await self._finish_lien_page(data, *page_job)
                 if data:
-                    self.results.append(data)
                     await self._append_result_to_excel(data)
                     console.print(f"[cyan]Saved data for --> {data.get('direct_party_debtor', 'Unknown')}[/cyan]")
                 else:
                     print(f"No data found")
-                    
+
                 # mark row as done in CSV
                 result_urls.at[index, "status"] = "Done"
-                result_urls.to_csv(self.csv_path, index=False)
-
-        except Exception as e:
-            console.print(f"[red]Error in process_result_urls: {e}[/red]")
-            traceback.format_exc()
+                await self._save_url_status(result_urls)
+            except Exception as e:
+                console.print(f"[red]Error saving record {index + 1}: {e}[/red]")
+            finally:
+                ocr_queue.task_done()
 
 
-    async def parse_lien_data(self):
-        """ Helper: Parse lien detail page """
+    async def parse_lien_data(self, page=None, page_html: str | None = None):
+        """
+        Helper: Parse lien detail page; `page_html` is the navigation response body when available.
+        Returns (data, page_job): page_job is the screenshot work for _finish_lien_page, or None.
+        """
+        page = page or self.page
         await self.stop_check()
+        page_job = None
         try:
-            await self.page.wait_for_load_state("domcontentloaded", timeout=15000)
-            await self.page.wait_for_timeout(self.time_sleep())
-            html = await self.page.content()
-            soup = BeautifulSoup(html, "html.parser")
-            data = {}
-
-            def safe_text(el):
-                return el.get_text(" ", strip=True) if el else ""
+            if page_html is None:
+                await page.wait_for_load_state("domcontentloaded", timeout=15000)
+                # the detail tables are server-rendered; wait for them instead of a fixed sleep
+                await page.wait_for_selector("table", state="attached", timeout=15000)
+                page_html = await page.content()
 
             # ---------- Data Extraction ----------
-            doc_table = soup.find("table", width="800", cellpadding="0", cellspacing="0")
-            if doc_table:
-                rows = doc_table.find_all("tr")[1:]
-                if rows:
-                    cols = [safe_text(td) for td in rows[0].find_all("td")]
-                    if len(cols) >= 6:
-                        data.update({
-                            "county": cols[0],
-                            "instrument": cols[1],
-                            "date_filed": cols[2],
-                            "time": cols[3],
-                            "book": cols[4],
-                            "page": cols[5],
-                        })
-
-            desc_table = soup.find("td", string=lambda t: t and "Description" in t)
-            if desc_table:
-                tbody = desc_table.find_parent("table")
-                desc_val = safe_text(tbody.find_all("tr")[1].find("td"))
-                data["description"] = desc_val
-                data["amount"] = self.extract_amount(desc_val)
-
-            debtor_table = soup.find("td", string=lambda t: t and "Direct Party (Debtor)" in t)
-            if debtor_table:
-                tbody = debtor_table.find_parent("table")
-                debtors = [safe_text(td) for td in tbody.find_all("td")[1:]]
-                data["direct_party_debtor"] = "; ".join(debtors)
-
-            claimant_table = soup.find("td", string=lambda t: t and "Reverse Party (Claimant)" in t)
-            if claimant_table:
-                tbody = claimant_table.find_parent("table")
-                claimants = [safe_text(td) for td in tbody.find_all("td")[1:]]
-                data["reverse_party_claimant"] = "; ".join(claimants)
+            data = self._parse_lien_tables(page_html)
 
             # ---------- PDF Extraction ----------
-            viewer_script = soup.find("script", string=lambda t: t and "ViewImage" in t)
-            if viewer_script:
-                script_text = viewer_script.string
-                match = re.search(r'var iLienID\s*=\s*(\d+);', script_text)
+            script_text = viewer_script_text(page_html)
+            if script_text:
+                match = VIEWER_SCRIPT_PATTERN.search(script_text)
                 if match:
-                    lien_id = match.group(1)
-                    county = re.search(r'var county\s*=\s*"(\d+)"', script_text).group(1)
-                    book = re.search(r'var book\s*=\s*"(\d+)"', script_text).group(1)
-                    page_num = re.search(r'var page\s*=\s*"(\d+)"', script_text).group(1)
-                    userid = re.search(r'var user\s*=\s*(\d+)', script_text).group(1)
-                    appid = re.search(r'var appid\s*=\s*(\d+)', script_text).group(1)
-
-                    viewer_url = (
-                        f"https://search.gsccca.org/Imaging/HTML5Viewer.aspx?" \
-                        f"id={lien_id}&key1={book}&key2={page_num}&county={county}&userid={userid}&appid={appid}"
+                    lien_id, county, book, page_num, userid, appid = match.group(
+                        "id", "county", "book", "page", "user", "appid"
+                    )
+                    viewer_url = VIEWER_URL_TEMPLATE.format(
+                        lien_id=lien_id, book=book, page_num=page_num, county=county, userid=userid, appid=appid
                     )
                     data["pdf_document_url"] = viewer_url
                     debtor_name = data.get("direct_party_debtor", "unkown_debtor").split(";")[0][:40]
@@ -669,91 +1088,361 @@ class LienIndexScraper:
                     pdf_path = os.path.join(self.documents_dir, pdf_name)
 
                     try:
-                        popup = await self.page.context.new_page()
+                        popup = await self._viewer_pages.get(page)
                         await popup.goto(viewer_url, wait_until="domcontentloaded", timeout=50000)
-                        await self.page.wait_for_timeout(5000)
 
                         # Select "Fit Window" option
-                        await popup.wait_for_selector("td.vtm_zoomSelectCell select", timeout=10000)
+                        await popup.wait_for_selector("td.vtm_zoomSelectCell select", timeout=15000)
                         await popup.select_option("td.vtm_zoomSelectCell select", "fitwindow")
-                        await self.page.wait_for_timeout(2000)
+                        # wait for the page to be painted instead of sleeping a fixed time
+                        await popup.wait_for_function(
+                            VIEWER_CANVAS_STATE_JS, arg=VIEWER_CANVAS_SELECTOR, timeout=15000
+                        )
+                        before_rotate = await popup.evaluate(VIEWER_CANVAS_STATE_JS, VIEWER_CANVAS_SELECTOR)
                         await popup.locator('img[title="Rotate Right"]').click()
+                        try:
+                            await popup.wait_for_function(
+                                f"(sel) => {{ const s = ({VIEWER_CANVAS_STATE_JS})(sel); return s && s !== {json.dumps(before_rotate)}; }}",
+                                arg=VIEWER_CANVAS_SELECTOR, timeout=4000,
+                            )
+                        except pw.TimeoutError:
+                            pass  # viewer redraw not observable from the canvas, capture as-is
 
-                        await popup.wait_for_selector("div.vtm_imageClipper canvas", timeout=10000, state="attached")
-                        await self.page.wait_for_timeout(2000)
-                        canvas = await popup.query_selector("div.vtm_imageClipper canvas")
+                        canvas = await popup.query_selector(VIEWER_CANVAS_SELECTOR)
 
                         if canvas:
-                            tmp_img = os.path.join(self.documents_dir, f"tmp_{page_num}.png")
+                            # keep the screenshot in memory, no temp file round-trip
                             try:
-                                await canvas.screenshot(path=tmp_img, timeout=30000)
-                                if not (os.path.exists(tmp_img) and os.path.getsize(tmp_img) > 0):
+                                page_png = await canvas.screenshot(timeout=30000)
+                                if not page_png:
                                     print("[WARNING] screenshot missing, trying full page screenshot...")
-                                    await popup.screenshot(path=tmp_img, full_page=True, timeout=30000)
+                                    page_png = await popup.screenshot(full_page=True, timeout=30000)
                                     print(f"Full page screenshot saved!")
                             except Exception as screenshot_error:
                                 console.print(f"[red][ERROR] Canvas screenshot failed: {screenshot_error}" \
                                     "\nTrying full page screenshot...[/red]")
-                                await popup.screenshot(path=tmp_img, full_page=True, timeout=30000)
+                                page_png = await popup.screenshot(full_page=True, timeout=30000)
                                 print(f"Full page screenshot saved!")
 
-                            # Rotate CCW once and overwrite
-                            with Image.open(tmp_img) as im:
-                                im = ImageOps.exif_transpose(im)
-                                im = im.rotate(90, expand=True)
-                                im.save(tmp_img)
+                            # PDF + OCR finish in an OCR consumer; this tab moves on to the next URL
+                            page_job = (page_png, pdf_path, pdf_name)
+                    except Exception as e:
+                        print(f"[ERROR] PDF generation failed: {e}")
+            return data, page_job
+        except Exception as e:
+            console.print(f"[red]Error in parse_lien_data: {e}[/red]\n{traceback.format_exc()}")
+            return {}, None
+
+
+    async def _finish_lien_page(self, data: dict, page_png: bytes, pdf_path: str, pdf_name: str):
+        """ Write the viewer screenshot's PDF and fill `data` with its OCR fields (OCR pool). """
+        try:
+            # PDF write and OCR image decode run in the pool, off the event loop
+            loop = asyncio.get_running_loop()
+            pdf_job = loop.run_in_executor(self._ocr_pool, self._write_page_pdf, page_png, pdf_path)
+            # identical page images (re-runs, resumed batches) reuse the stored OCR
+            ocr_key = hashlib.blake2b(page_png, digest_size=16).hexdigest()
+            cached_ocr = await self._load_ocr_cache(ocr_key)
+            ocr_images_job = None if cached_ocr else loop.run_in_executor(
+                self._ocr_pool, self._decode_ocr_images, page_png
+            )
+            await pdf_job
 
-                            # now convert the rotated image to PDF
-                            with open(pdf_path, "wb") as f:
-                                f.write(img2pdf.convert([tmp_img]))
+            data["pdf_filename"] = pdf_name
+            print(f"PDF document saved to --> {pdf_path}")
 
-                            data["pdf_filename"] = pdf_name
-                            print(f"PDF document saved to --> {pdf_path}")
+            # ----------- OCR Extraction + Address1/2 -----------
+            try:
+                if cached_ocr:
+                    text, ocr_json, total_due = cached_ocr["text"], cached_ocr["ocr_json"], cached_ocr["total_due"]
+                    print(f"OCR cache hit --> {ocr_key}")
+                else:
+                    img, ocr_img = await ocr_images_job
+
+                    # run the independent OCR passes concurrently in the OCR pool;
+                    # a failure in one pass must not blank the fields of the others
+                    from ocr.ocr_tax_extractor import process_cv2_image
+                    page_ocr, ocr_json = await asyncio.gather(
+                        loop.run_in_executor(self._ocr_pool, self._ocr_page, img),
+                        loop.run_in_executor(self._ocr_pool, process_cv2_image, ocr_img),
+                        return_exceptions=True,
+                    )
+                    text, total_box = page_ocr if not isinstance(page_ocr, Exception) else (page_ocr, None)
+                    # the page pass located the Total Due line, so only that strip is re-read;
+                    # the page is preprocessed only if the raw strip has no amount
+                    total_due = await loop.run_in_executor(
+                        self._ocr_pool, self.extract_total_due, img, None, None, total_box,
+                    )
+                    for label, result in (("page OCR", text), ("OCR JSON", ocr_json)):
+                        if isinstance(result, Exception):
+                            print(f"[ERROR] {label} failed: {result}")
+                    # extract_total_due reports its own failures as "Error"
+                    if total_due != "Error" and not any(isinstance(r, Exception) for r in (text, ocr_json)):
+                        await self._save_ocr_cache(ocr_key, text, ocr_json, total_due)
+                text = "" if isinstance(text, Exception) else text
+                ocr_json = {} if isinstance(ocr_json, Exception) else ocr_json
+                data["ocr_raw_text"] = text.strip()
 
-                            # ----------- OCR Extraction + Address1/2 -----------
-                            try:
-                                img = Image.open(tmp_img).convert("L")
-                                text = pytesseract.image_to_string(img, lang="eng")
-                                data["ocr_raw_text"] = text.strip()
-
-                                # extract addresses and total due
-                                from ocr.ocr_tax_extractor import process_cv2_image
-                                addr_list = self.extract_addresses_from_ocr(data["ocr_raw_text"], max_addresses=2)
-                                ocr_img = cv2.imread(str(tmp_img))
-                                ocr_json = process_cv2_image(ocr_img)
-                                print(f"OCR JSON Data: {ocr_json}\nAddresses: {addr_list}")
-                                
-                                addr_1 = " | ".join(
-                                    addr["address"].strip()
-                                    for addr in addr_list
-                                    if isinstance(addr.get("address"), str) and addr["address"].strip()
-                                )
-                                data["total_due"] = self.extract_total_due(img=img) or ""
-                                data["ocr_description"] = ocr_json.get("description", "")
-                                first_amount = (
-                                ocr_json.get("amounts", {})
-                                    .get("top_by_score", [{}])[0]
-                                    .get("numeric")
-                                )
-
-                                addresses = ocr_json.get("addresses", [])
-                                print("OCR Addresses: ", addresses)
-                                data["zipcode"] = addr_list[1]["zipcode"] or ""
-                                from ocr.addr import merge_address_lists
-                                data["ocr_address"] = merge_address_lists(addr_list, addresses)
-                                data["ocr_total_due"] = str(first_amount)
+                try:
+                    data["ocr_description"] = ocr_json.get("description", "")
+                    top_amounts = ocr_json.get("amounts", {}).get("top_by_score") or [{}]
+                    ocr_total_due = top_amounts[0].get("numeric")
+                    # the Total Due strip pass fills the column when the JSON extractor ranked no amount
+                    if ocr_total_due is None and total_due not in ("Not found", "Error"):
+                        ocr_total_due = total_due
+                    data["ocr_total_due"] = str(ocr_total_due)
+                except Exception as e:
+                    print(f"[ERROR] OCR amount extraction failed: {e}")
 
-                            except Exception as e:
-                                print(f"[ERROR] OCR extraction failed: {e}")
+                # extract addresses; prefer the second (debtor) address, else the first found
+                try:
+                    addr_list = self.extract_addresses_from_ocr(data["ocr_raw_text"], max_addresses=2)
+                    print(f"OCR JSON Data: {ocr_json}\nAddresses: {addr_list}")
+                    addresses = ocr_json.get("addresses", [])
+                    print("OCR Addresses: ", addresses)
+                    picked = addr_list[1] if addr_list[1]["address"] else addr_list[0]
+                    data["zipcode"] = picked["zipcode"] or ""
+                    from ocr.addr import merge_address_lists
+                    data["ocr_address"] = merge_address_lists(addr_list, addresses)
+                except Exception as e:
+                    print(f"[ERROR] OCR address extraction failed: {e}")
 
-                            os.remove(tmp_img)
-                    except Exception as e:
-                        print(f"[ERROR] PDF generation failed: {e}")
-                    await popup.close()
-            return data
+            except Exception as e:
+                print(f"[ERROR] OCR extraction failed: {e}")
         except Exception as e:
-            console.print(f"[red]Error in parse_lien_data: {e}[/red]\n{traceback.format_exc()}")
-            return {}
+            print(f"[ERROR] PDF generation failed: {e}")
+
+
+    def _ocr_cache_path(self, key: str) -> Path:
+        return self.ocr_cache_dir / f"{key}.json"
+
+
+    async def _load_ocr_cache(self, key: str) -> dict | None:
+        """ Stored OCR results for a page image hash, or None on miss / unreadable entry. """
+        if key in self._ocr_memo:
+            return self._ocr_memo[key]
+        entry = await asyncio.to_thread(self._read_ocr_cache_file, self._ocr_cache_path(key))
+        if entry is not None:
+            self._remember_ocr(key, entry)
+        return entry
+
+
+    @staticmethod
+    def _read_ocr_cache_file(path: Path) -> dict | None:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+    def _remember_ocr(self, key: str, entry: dict):
+        if len(self._ocr_memo) >= OCR_MEMO_SIZE:
+            self._ocr_memo.pop(next(iter(self._ocr_memo)))  # drop the oldest entry
+        self._ocr_memo[key] = entry
+
+
+    async def _save_ocr_cache(self, key: str, text: str, ocr_json: dict, total_due: str):
+        entry = {"text": text, "ocr_json": ocr_json, "total_due": total_due}
+        # the memo is only touched on the event loop; the file is written in a thread
+        self._remember_ocr(key, entry)
+        await asyncio.to_thread(self._write_ocr_cache_file, self._ocr_cache_path(key), entry)
+
+
+    @staticmethod
+    def _write_ocr_cache_file(path: Path, entry: dict):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, default=str)
+        except OSError as e:
+            console.print(f"[red]Failed to save OCR cache: {e}[/red]")
+
+
+    def _tess_api(self):
+        """ Return this thread's tesserocr API, creating it on first use. """
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang="eng")
+            self._tess_local.api = api
+            self._tess_apis.append(api)
+        return api
+
+
+    def _tess_line_api(self):
+        """ This thread's single-line, Total-Due-whitelisted tesserocr API (kept separate so the
+        whitelist never leaks into full-page OCR). """
+        api = getattr(self._tess_local, "line_api", None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.SINGLE_LINE)
+            api.SetVariable("tessedit_char_whitelist", TOTAL_DUE_WHITELIST)
+            self._tess_local.line_api = api
+            self._tess_apis.append(api)
+        return api
+
+
+    def _warm_ocr_worker(self):
+        """ Pool initializer: load this thread's Tesseract model before the first page arrives. """
+        if tesserocr is None:
+            return
+        try:
+            api = self._tess_api()
+            self._set_tess_image(api, np.full((32, 32), 255, np.uint8))
+            api.GetUTF8Text()
+        except Exception as e:
+            console.print(f"[red]Error in _warm_ocr_worker: {e}[/red]")
+
+
+    def _warm_kernels(self):
+        """ Load/compile the numba kernels once, in the pool, while the browser logs in. """
+        if njit is None:
+            return
+        try:
+            blank = np.zeros((64, 64), np.uint8)
+            out = np.empty_like(blank)
+            _strip_lines(blank, 8, 8, out, True)
+            _mean_threshold_inv(blank, cv2.integral(blank), 31, 10.0, out)
+        except Exception as e:
+            console.print(f"[red]Error in _warm_kernels: {e}[/red]")
+
+
+    def _close_ocr(self):
+        """ Shut down the OCR pool and release the tesserocr APIs. """
+        self._ocr_pool.shutdown(wait=True)
+        for api in self._tess_apis:
+            api.End()
+        self._tess_apis.clear()
+
+
+    def _write_page_pdf(self, page_png: bytes, pdf_path: str):
+        """ Wrap the viewer PNG into a PDF, rotated CCW via /Rotate (no re-encode). """
+        Path(pdf_path).write_bytes(img2pdf.convert(page_png, rotation=img2pdf.Rotation["270"]))
+
+
+    def _decode_ocr_images(self, page_png: bytes) -> tuple[np.ndarray, np.ndarray]:
+        """ Decode the viewer PNG once and rotate it CCW; return (grayscale, BGR) arrays for OCR. """
+        bgr = cv2.imdecode(np.frombuffer(page_png, np.uint8), cv2.IMREAD_COLOR)
+        bgr = cv2.rotate(bgr, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        return cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY), bgr
+
+
+    @staticmethod
+    def _set_tess_image(api, gray: np.ndarray):
+        """ Hand a 2D uint8 array to tesserocr as raw bytes, no PIL/PNG round-trip. """
+        gray = np.ascontiguousarray(gray)
+        height, width = gray.shape
+        api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+
+
+    def _ocr_page(self, img: np.ndarray) -> tuple[str, tuple | None]:
+        """
+        Plain-text OCR of one viewer page; runs inside self._ocr_pool.
+        Also returns the (x0, y0, x1, y1) box of the Total Due line, if any, from the same pass.
+        """
+        if tesserocr is None:
+            d = pytesseract.image_to_data(img, lang="eng", output_type=pytesseract.Output.DICT)
+            lines = {}
+            for i, txt in enumerate(d["text"]):
+                if txt.strip():
+                    lines.setdefault((d["block_num"][i], d["par_num"][i], d["line_num"][i]), []).append(i)
+            text_lines, box, prev_block = [], None, None
+            for key, idx in lines.items():
+                if prev_block is not None and key[0] != prev_block:
+                    text_lines.append("")
+                prev_block = key[0]
+                line = " ".join(d["text"][i] for i in idx)
+                text_lines.append(line)
+                if box is None and TOTAL_LINE_REGEX.search(line):
+                    box = (
+                        min(d["left"][i] for i in idx),
+                        min(d["top"][i] for i in idx),
+                        max(d["left"][i] + d["width"][i] for i in idx),
+                        max(d["top"][i] + d["height"][i] for i in idx),
+                    )
+            return "\n".join(text_lines), box
+
+        api = self._tess_api()
+        api.SetPageSegMode(tesserocr.PSM.AUTO)
+        api.SetVariable("preserve_interword_spaces", "0")
+        self._set_tess_image(api, img)
+        api.Recognize()
+        text, box = api.GetUTF8Text(), None
+        it = api.GetIterator()
+        if it is not None:  # None when the page has no text (blank or faint scan)
+            for line_it in tesserocr.iterate_level(it, tesserocr.RIL.TEXTLINE):
+                if TOTAL_LINE_REGEX.search(line_it.GetUTF8Text(tesserocr.RIL.TEXTLINE) or ""):
+                    box = line_it.BoundingBox(tesserocr.RIL.TEXTLINE)
+                    break
+        return text, box
+
+
+    def _ocr_total_due_strip(self, proc: np.ndarray, box: tuple, scale: float) -> str | None:
+        """ OCR only the Total Due line strip of the preprocessed page (single line, whitelisted). """
+        x0, y0, x1, y1 = (int(round(v * scale)) for v in box)
+        pad = int(round(5 * scale))
+        strip = proc[max(0, y0 - pad):min(proc.shape[0], y1 + pad), max(0, x0 - pad):]
+        if strip.size == 0:
+            return None
+        if tesserocr is None:
+            cfg = f'--oem 3 --psm 7 -l eng -c "tessedit_char_whitelist={TOTAL_DUE_WHITELIST}"'
+            line = pytesseract.image_to_string(strip, config=cfg)
+        else:
+            api = self._tess_line_api()
+            self._set_tess_image(api, strip)
+            line = api.GetUTF8Text()
+        line = line.strip()
+        return line if CURRENCY_PATTERN.search(line) else None
+
+
+    def _parse_lien_tables(self, page_html: str) -> dict:
+        """ Parse document/description/debtor/claimant tables in a single lxml pass. """
+        data = {}
+        try:
+            # no NA sniffing: a party literally named "NA" / "NULL" must stay text. header=None
+            # keeps each header label in its column, so book/page are never cast to numbers
+            tables = pd.read_html(
+                io.StringIO(page_html), flavor="lxml", header=None, keep_default_na=False, na_values=[]
+            )
+        except ValueError:
+            return data
+
+        def cell(v):
+            return " ".join(str(v).split())
+
+        # substring match on the header cell like the old BS4 lookup; when tables are nested the
+        # outer frame's cell holds the inner text too, so the shortest (innermost) match wins
+        sections = {}
+        for df in tables:
+            if df.shape[0] < 2:
+                continue
+            head = [cell(v) for v in df.iloc[0]]
+            label = head[0]
+
+            if "county" not in data and label.rstrip(":") == "County" and "Instrument" in head and df.shape[1] >= 6:
+                cols = [cell(v) for v in df.iloc[1]]
+                data.update({
+                    "county": cols[0],
+                    "instrument": cols[1],
+                    "date_filed": cols[2],
+                    "time": cols[3],
+                    "book": cols[4],
+                    "page": cols[5],
+                })
+                continue
+            for key, text in LIEN_SECTION_LABELS.items():
+                if text in label and (key not in sections or len(label) < len(sections[key][0])):
+                    sections[key] = (label, df)
+
+        if "description" in sections:
+            data["description"] = cell(sections["description"][1].iloc[1, 0])
+            data["amount"] = self.extract_amount(data["description"])
+        for key in ("direct_party_debtor", "reverse_party_claimant"):
+            if key in sections:
+                label, df = sections[key]
+                # every cell after the label, row by row; read_html copies a colspan/rowspan cell
+                # into each slot it spans, so repeated values (and copies of the label) are dropped
+                cells = dict.fromkeys(cell(v) for v in df.to_numpy().ravel()[1:])
+                data[key] = "; ".join(v for v in cells if v and v != label)
+        return data
 
 
     def extract_addresses_from_ocr(self, text, max_addresses=2):
@@ -764,33 +1453,38 @@ class LienIndexScraper:
             lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
             addresses = []
 
-            for idx, ln in enumerate(lines):
-                m = re.search(r'([A-Za-z][A-Za-z0-9\.\'&\-\s]+,\s*[A-Za-z]{2}\s*\d{5})', ln)
-                if m:
-                    city_state_zip = m.group(1).strip()
-                    street = ""
-                    for j in range(1, 4):
-                        if idx - j < 0:
-                            break
-                        prev = lines[idx - j]
-                        if re.search(r'\b(County|Tax|Commissioner|Recorded|Doc:|Rept#|VS\b|Defendant|GRANT|PAYMENT|TOTAL DUE|PHONE|TEL|Fax)\b', prev, re.I):
-                            continue
-                        if re.search(r'^\d+\s', prev) or re.search(r'\b(St(reet)?|Street|Rd(?!\w)|Road|Highway|HWY|Ave|Avenue|Blvd|Lane|Ln|Dr(?!\w)|Drive|Way|Court|Ct|Parkway|PKWY|Memorial|HWY|HW|HWY|WY|SW|NE|N\.E\.|S\.W\.)\b', 
-                            prev, re.I) or re.search(r'\d', prev):
-                            street = prev
-                            break
-                        if not re.search(r'^\b(Grant|GORDON|GORDON COUNTY|SCOTT|LIEN|LIEN Bk|TOTAL|PAYMENT)\b', prev, re.I):
-                            street = prev
-                            break
-
-                    full_address = (street + " " + city_state_zip).strip() if street else city_state_zip
-                    zip_m = re.search(r'(\d{5})$', city_state_zip)
-                    zipcode = zip_m.group(1) if zip_m else ""
-                    addresses.append({"address": full_address, "zipcode": zipcode})
-
-                    if len(addresses) >= max_addresses:
+            # one pass over the whole page; NUL matches no part of the pattern, so no match spans
+            # two lines, and offsets map each match back to its line
+            page_text = "\x00".join(lines)
+            line_starts = list(itertools.accumulate((len(ln) + 1 for ln in lines[:-1]), initial=0))
+            last_idx = -1
+            for m in CITY_STATE_ZIP_PATTERN.finditer(page_text):
+                idx = bisect.bisect_right(line_starts, m.start()) - 1
+                if idx == last_idx:
+                    continue  # first match per line only
+                last_idx = idx
+                city_state_zip = m.group(1).strip()
+                street = ""
+                for j in range(1, 4):
+                    if idx - j < 0:
+                        break
+                    prev = lines[idx - j]
+                    if ADDRESS_HEADER_PATTERN.search(prev):
+                        continue
+                    if STREET_LINE_PATTERN.search(prev):
+                        street = prev
+                        break
+                    if not ADDRESS_SKIP_PATTERN.search(prev):
+                        street = prev
                         break
 
+                full_address = (street + " " + city_state_zip).strip() if street else city_state_zip
+                zipcode = m.group("zip")
+                addresses.append({"address": full_address, "zipcode": zipcode})
+
+                if len(addresses) >= max_addresses:
+                    break
+
             while len(addresses) < max_addresses:
                 addresses.append({"address": "", "zipcode": ""})
             return addresses
@@ -799,14 +1493,28 @@ class LienIndexScraper:
             return [{"address": "", "zipcode": ""} for _ in range(max_addresses)]
     
     
-    def extract_total_due(self, img):          
+    def extract_total_due(self, img, proc=None, line=None, box=None):
+        """
+        Total Due amount from the page; `proc` / `line` skip work already done by the caller.
+        With `box` (Total Due line located by the page OCR) only that strip is OCR'd, first on
+        the raw grayscale page; preprocess_page and the page-wide find_total_due_line pass only
+        run when that fails.
+        """
         try:
-            pil = img.convert("RGB")
-            
-            proc = self.preprocess_page(pil)
-            line = self.find_total_due_line(proc)
+            if line is None and box is not None and proc is None:
+                raw = img if isinstance(img, np.ndarray) else np.array(img.convert("L"))
+                if raw.ndim == 3:
+                    raw = cv2.cvtColor(raw, cv2.COLOR_BGR2GRAY)
+                line = self._ocr_total_due_strip(raw, box, 1.0)
+            if line is None and proc is None:
+                proc = self.preprocess_page(img)  # raw strip unreadable, fall back to the cleaned page
+            if line is None and box is not None:
+                src_w = img.shape[1] if isinstance(img, np.ndarray) else img.size[0]
+                line = self._ocr_total_due_strip(proc, box, proc.shape[1] / src_w)
+            if line is None:
+                line = self.find_total_due_line(proc)
             if line:
-                m = re.search(r'(?<!\d)(\d{1,3}(?:,\d{3})*(?:\.\d{2})|\d+\.\d{2})(?!\d)', line)
+                m = CURRENCY_PATTERN.search(line)
                 line = m.group(1).replace(',', '') if m else None
             line = line if line else "Not found"
             print(f"Total Due: {line}")
@@ -816,13 +1524,27 @@ class LienIndexScraper:
             return "Error"
 
 
-    def remove_table_lines(self, bw_inv: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _table_line_lengths(shape: tuple) -> tuple[int, int]:
+        """ Minimum run (px) for a horizontal / vertical stroke to count as a table line. """
+        h, w = shape[:2]
+        return max(20, w // 30), max(20, h // 30)
+
+
+    def remove_table_lines(self, bw_inv, shape: tuple | None = None):
+        """ Strip table rulings from an inverted binary image; `shape` is required for a cv2.UMat. """
         try:
-            h, w = bw_inv.shape[:2]
-            h_len = max(20, w // 30)
-            v_len = max(20, h // 30)
-            h_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (h_len, 1))
-            v_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, v_len))
+            h_len, v_len = self._table_line_lengths(shape or bw_inv.shape)
+            if (_strip_lines is not None and isinstance(bw_inv, np.ndarray)
+                    and bw_inv.ndim == 2 and bw_inv.dtype == np.uint8):
+                out = np.empty_like(bw_inv)
+                _strip_lines(np.ascontiguousarray(bw_inv), h_len, v_len, out, False)
+                return out
+            if isinstance(bw_inv, np.ndarray) and bw_inv.ndim == 2:
+                return _strip_lines_packed(bw_inv, h_len, v_len)
+
+            h_kernel = _rect_kernel(h_len, 1)
+            v_kernel = _rect_kernel(1, v_len)
             horiz = cv2.morphologyEx(bw_inv, cv2.MORPH_OPEN, h_kernel, iterations=1)
             vert  = cv2.morphologyEx(bw_inv, cv2.MORPH_OPEN, v_kernel, iterations=1)
             grid  = cv2.bitwise_or(horiz, vert)
@@ -832,32 +1554,83 @@ class LienIndexScraper:
             return bw_inv
 
 
-    def preprocess_page(self,pil_img: Image.Image) -> np.ndarray:
+    @staticmethod
+    def _glyph_scale(gray: np.ndarray) -> float:
+        """ Downscale factor (<= 1.0) bringing the median glyph height to TARGET_GLYPH_HEIGHT. """
+        _, bw_inv = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU)
+        contours, _ = cv2.findContours(bw_inv, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        heights = [h for _, _, w, h in map(cv2.boundingRect, contours) if 4 <= h <= 200 and w <= 4 * h]
+        if len(heights) < 20:
+            return 1.0  # too few glyph-sized blobs to trust the estimate
+        return min(1.0, TARGET_GLYPH_HEIGHT / float(np.median(heights)))
+
+
+    def preprocess_page(self,pil_img) -> np.ndarray:
         try:
-            img = np.array(pil_img.convert("RGB"))
-            gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
-            scale = 2.0 if max(gray.shape) < 2000 else 1.5
-            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+            # the OCR image is already grayscale, skip the L -> RGB -> GRAY round-trip
+            if isinstance(pil_img, np.ndarray):
+                gray = pil_img if pil_img.ndim == 2 else cv2.cvtColor(pil_img, cv2.COLOR_BGR2GRAY)
+            elif pil_img.mode == "L":
+                gray = np.array(pil_img)
+            else:
+                gray = cv2.cvtColor(np.array(pil_img.convert("RGB")), cv2.COLOR_RGB2GRAY)
+            shape = gray.shape
+            # large canvases: shrink oversized glyphs instead of feeding Tesseract extra pixels
+            scale = self._glyph_scale(gray) if max(shape) >= 1500 else 1.0
+            use_ocl = _mean_threshold_inv is None and OPENCL_AVAILABLE
+            if use_ocl:
+                gray = cv2.UMat(gray)  # one upload; every step below stays on the device
+            # upscale small pages only; large ones are already at a resolution Tesseract handles
+            if max(shape) < 1500:
+                gray = cv2.resize(gray, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_LINEAR)
+                shape = (shape[0] * 2, shape[1] * 2)
+                block_size = 31
+            else:
+                if scale < 0.9:
+                    shape = (int(round(shape[0] * scale)), int(round(shape[1] * scale)))
+                    gray = cv2.resize(gray, (shape[1], shape[0]), interpolation=cv2.INTER_AREA)
+                block_size = 21  # same threshold window relative to text size without the upscale
             clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             gray = clahe.apply(gray)
+            if _mean_threshold_inv is not None:
+                bw_inv = np.empty_like(gray)
+                _mean_threshold_inv(gray, cv2.integral(gray), block_size, 10.0, bw_inv)
+                # strip lines and invert in one write, reusing the CLAHE buffer as output
+                h_len, v_len = self._table_line_lengths(shape)
+                _strip_lines(bw_inv, h_len, v_len, gray, True)
+                return gray
+
             bw_inv = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 31, 10
+                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, block_size, 10
             )
-            clean_inv = self.remove_table_lines(bw_inv)
-            return cv2.bitwise_not(clean_inv)
+            clean = cv2.bitwise_not(self.remove_table_lines(bw_inv, shape))
+            return clean.get() if use_ocl else clean
         except Exception as e:
             console.print(f"[red]Error in preprocess_page: {e}[/red]")
+            if isinstance(pil_img, np.ndarray):
+                return pil_img
             return np.array(pil_img.convert("L"))
         
 
     def find_total_due_line(self, proc_img: np.ndarray) -> str | None:
         """ Find line containing 'Total Due' or similar keywords. """
         try:
+            if tesserocr is not None:
+                api = self._tess_api()
+                api.SetPageSegMode(tesserocr.PSM.SINGLE_BLOCK)
+                api.SetVariable("preserve_interword_spaces", "1")
+                self._set_tess_image(api, proc_img)
+                api.Recognize()
+                it = api.GetIterator()
+                if it is not None:  # None when the page has no text
+                    for line_it in tesserocr.iterate_level(it, tesserocr.RIL.TEXTLINE):
+                        line = (line_it.GetUTF8Text(tesserocr.RIL.TEXTLINE) or "").strip()
+                        if TOTAL_LINE_REGEX.search(line):
+                            return line
+                return None
+
+            # image_to_data already carries the page text; one Tesseract run per page
             cfg_page = "--oem 3 --psm 6 -l eng -c preserve_interword_spaces=1"
-            page_text = pytesseract.image_to_string(proc_img, config=cfg_page)
-            for raw in page_text.splitlines():
-                if raw.strip() and TOTAL_LINE_REGEX.search(raw.upper()):
-                    return raw
             data_dict = pytesseract.image_to_data(proc_img, config=cfg_page, output_type=pytesseract.Output.DICT)
             lines = {}
             for i, txt in enumerate(data_dict["text"]):
@@ -866,7 +1639,7 @@ class LienIndexScraper:
                     lines.setdefault(key, []).append(txt)
             for parts in lines.values():
                 line = " ".join(parts).strip()
-                if TOTAL_LINE_REGEX.search(line.upper()):
+                if TOTAL_LINE_REGEX.search(line):
                     return line
             return None
         except Exception as e:
@@ -874,99 +1647,101 @@ class LienIndexScraper:
             return None
         
 
-    def save_to_excel(self, filename="lien_data.xlsx"):
-        """ Save scraped results to Excel with clickable PDF links. """
-        
-        if getattr(self, "excel_path", "") and os.path.exists(self.excel_path):
-            print("-" * 50)
-            console.print(f"[bold green]Saved records incrementally to --> {self.excel_path}[/bold green]")
-            print("-" * 50)
-            
-            # if getattr(self, "csv_path", "") and os.path.exists(self.csv_path):
-            #     os.remove(self.csv_path)
+    async def _close_context(self):
+        """ Close this run's browser context (idempotent; the shared browser stays up). """
+        context, self.context = self.context, None
+        if context:
+            try:
+                await context.close()
+            except pw.Error:
+                pass  # already closed by a stop request
 
-            if getattr(self, "resume_state_path", "") and os.path.exists(self.resume_state_path):
-                os.remove(self.resume_state_path)
 
-            return
+    async def _save_and_close(self):
+        """ Build the workbook in a thread while the browser context shuts down. """
+        await asyncio.gather(asyncio.to_thread(self.save_to_excel), self._close_context())
+
 
+    def save_to_excel(self):
+        """ Build the session workbook (clickable PDF links) from the row log. """
+        if self._rows_file is not None:
+            self._rows_file.close()
+            self._rows_file = None
 
         try:
-            if not hasattr(self, "results") or not self.results:
-                print("[red][WARNING] No results to save![/red]")
+            rows_path = self._rows_path() if self.excel_path else ""
+            if not rows_path or not os.path.exists(rows_path):
+                console.print("[red][WARNING] No results to save![/red]")
                 return
 
-            df = pd.DataFrame(self.results)
-            columns = {
-                "county": "County",
-                "direct_party_debtor": "Direct Party (Debtor)",
-                "reverse_party_claimant": "Reverse Party (Claimant)",
-                "ocr_address": "Address",
-                "zipcode": "Zipcode",
-                "ocr_total_due": "Total Due",
-                "instrument": "Instrument",
-                "date_filed": "Date Filed",
-                "book": "Book",
-                "page": "Page",
-                "ocr_description": "Description",
-                "amount": "Amount",
-                "pdf_document_url": "PDF Document URL",
-                "pdf_filename": "View PDF",
-            }
-
-            df.rename(columns=columns, inplace=True)
-            for data_col, xl_col in columns.items():
-                if xl_col not in df.columns.tolist():
-                    df[xl_col] = ""
-
-            df = df[list(columns.values())]
-
-            if "View PDF" in df.columns:
-                df["View PDF"] = df["View PDF"].apply(
-                    lambda x: f'=HYPERLINK("file:///{os.path.join(self.documents_dir, x).replace(os.sep, "/")}", "{x}")'
-                    if isinstance(x, str) and x.strip() else ""
-                )
-
-            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base, ext = os.path.splitext(filename)
-            search_name = re.sub(r'[^a-zA-Z0-9]', '', self.form_data.get("search_name", "")).replace(" ", "_")
-            final_filename = f"{base}_{search_name}_{ts}{ext}"
-            final_path = os.path.join(self.county_folder_path, final_filename)
-
-            with pd.ExcelWriter(final_path, engine="openpyxl") as writer:
-                df.to_excel(writer, index=False)
-
+            count = self._rows_to_excel(rows_path, self.excel_path)
+            os.remove(rows_path)
             print("-" * 50)
-            console.print(f"[bold green]Saved {len(df)} records to --> {final_path}[/bold green]")
+            console.print(f"[bold green]Saved {count} records to --> {self.excel_path}[/bold green]")
             print("-" * 50)
-            # os.remove(self.csv_path)
-            
-            if os.path.exists(self.resume_state_path):
+
+            if getattr(self, "resume_state_path", "") and os.path.exists(self.resume_state_path):
                 os.remove(self.resume_state_path)
 
         except Exception as e:
             console.print(f"[red]Error in save_to_excel: {e}[/red]")
 
 
+    def _rows_to_excel(self, rows_path: str, excel_path: str) -> int:
+        """
+        Stream the row log into xlsx row by row; O(1) memory, no DataFrame. Uses xlsxwriter
+        constant_memory with native PDF links when available, else _write_xlsx_fast.
+        """
+        headers = EXCEL_HEADERS
+        pdf_col = headers.index("View PDF")
+        # forward-slash documents URI built once, not joined/replaced per row
+        pdf_base = f"file:///{self.documents_dir.as_posix()}/"
+        tmp_path = excel_path + ".tmp.xlsx"
+        count = 0
+        with open(rows_path, newline="", encoding="utf-8") as f:
+            rows = csv.reader(f)
+            log_headers = next(rows, [])
+            if log_headers != headers:
+                # a log from an older version: map its columns onto the sheet's
+                pos = [log_headers.index(h) if h in log_headers else None for h in headers]
+                rows = ([row[i] if i is not None and i < len(row) else "" for i in pos] for row in rows)
+
+            if xlsxwriter is not None:
+                workbook = xlsxwriter.Workbook(tmp_path, {"constant_memory": True})
+                try:
+                    sheet = workbook.add_worksheet("Sheet1")
+                    sheet.write_row(0, 0, headers, workbook.add_format({"bold": True}))
+                    # constant_memory flushes row by row, so each row is written complete and in order
+                    for values in rows:
+                        count += 1
+                        for c, value in enumerate(values):
+                            if c == pdf_col and value.strip():
+                                sheet.write_url(count, c, pdf_base + value, string=value)
+                            elif value:
+                                sheet.write_string(count, c, value)
+                finally:
+                    workbook.close()
+            else:
+                count = _write_xlsx_fast(tmp_path, headers, rows, pdf_col, pdf_base)
+
+        # atomic replace so a crash mid-write never leaves a truncated workbook
+        os.replace(tmp_path, excel_path)
+        return count
+
+
     async def scrape(self, form_data: dict):
         """Run lien scraper dynamically with Django form data"""
         try:
             self.form_data = form_data
-            self.playwright = await pw.async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=HEADLESS,
-                channel="chrome",
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--start-maximized",
-                    "--no-proxy-server",
-                ]
-            )
+            # pay the numba / Tesseract cold start while Playwright launches and logs in
+            self._ocr_pool.submit(self._warm_kernels)
+            # warm browser shared across runs; only the context below is per run
+            self.browser = await acquire_browser(HEADLESS)
 
             print("Starting Lien Index Scraper...")
             print(f"Screen Resolution set to --> {WIDTH}x{HEIGHT}")
             context = await self.browser.new_context(
-                storage_state=STATE_FILE if STATE_FILE.exists() else None,
+                storage_state=session_state(STATE_FILE),
                 user_agent=UA,
                 locale=LOCALE,
                 timezone_id=TIMEZONE,
@@ -976,29 +1751,20 @@ class LienIndexScraper:
                 bypass_csp=True,
                 ignore_https_errors=False, 
             )
-            self.page = await context.new_page()
             self.context = context
+            self.page = await context.new_page()
+
+            # reuse the session saved in cookies.json, full login only when it has expired
+            await self.page.goto(self.name_search_url, wait_until="domcontentloaded", timeout=60000)
+            await self.check_and_handle_announcement()
 
-            # login if needed
-            await self.page.goto("https://google.com", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(self.time_sleep())
-            if STATE_FILE.exists():
-                # await context.add_cookies(json.loads(Path(STATE_FILE).read_text())["cookies"])
-                await self.page.goto(self.homepage, wait_until="domcontentloaded", timeout=60000)
-                await self.check_and_handle_announcement()
-            else:
-                await self.page.goto(self.login_url, wait_until="domcontentloaded")
-                await self.check_and_handle_announcement()
-                if not await self.check_session():
-                    print("Attempting fresh login...")
-                    await self.login()
-                    await self.page.wait_for_timeout(self.time_sleep())
-                        
             await self.stop_check()
             if not await self.check_session():
                 console.print("[yellow]Session invalid... logging in again...[/yellow]")
                 await self.login()
-                await self.page.wait_for_timeout(self.time_sleep())
+
+            # text-only scraping from here on; viewer popups are separate pages and stay unblocked
+            await self.page.route("**/*", block_heavy_resources)
 
             # ✅ Resume mode: skip search, continue from CSV (status != Done)
             if str(form_data.get("resume", "")).lower() in ("1", "true", "yes"):
@@ -1009,18 +1775,18 @@ class LienIndexScraper:
 
                 self.csv_path = state.get("csv_path")
                 self.county_folder_path = state.get("county_folder_path")
+                self.excel_path = state.get("excel_path", "")
 
                 if not self.csv_path or not os.path.exists(self.csv_path):
                     console.print(f"[red][ERROR] Resume CSV not found: {self.csv_path}[/red]")
                     return
 
                 if self.county_folder_path:
-                    os.makedirs(self.county_folder_path, exist_ok=True)
-                    self.documents_dir = os.path.join(self.county_folder_path, "documents")
-                    os.makedirs(self.documents_dir, exist_ok=True)
+                    self.documents_dir = Path(self.county_folder_path, "documents")
+                    self.documents_dir.mkdir(parents=True, exist_ok=True)
 
                 await self.process_result_urls()
-                self.save_to_excel()
+                await self._save_and_close()
                 return
 
             # Search using form data
@@ -1033,12 +1799,13 @@ class LienIndexScraper:
             await self.process_result_urls()
             
             # Save data to excel
-            self.save_to_excel()
+            await self._save_and_close()
         except Exception as e:
             console.print(f"[red]Error in scrape: {e}[/red]\n{traceback.format_exc()}")
         finally:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            await self._close_context()
+            if self._rows_file is not None:
+                self._rows_file.close()  # rows stay on disk for a resumed run
+            # the loop is shared with other runs: wait out in-flight OCR in a thread, not on it
+            await asyncio.to_thread(self._close_ocr)
 
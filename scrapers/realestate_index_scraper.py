@@ -1,35 +1,53 @@
 from __future__ import annotations
 
+import io
 import re
 import os
+import csv
 import json
+import asyncio
+import functools
 import random
 import img2pdf
 import traceback
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 import html
 
-from openpyxl import Workbook, load_workbook
+# keep Tesseract single-threaded, set before pytesseract spawns it
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 
 import pytesseract
 import cv2
 import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from PIL import Image, ImageOps
+from PIL import Image
 from rich.console import Console
 import playwright.async_api as pw
 
 from dashboard.utils.state import stop_scraper_flag 
+from scrapers.browser_pool import (
+    VIEWER_CANVAS_SELECTOR, VIEWER_CANVAS_STATE_JS, ViewerPages, acquire_browser,
+    block_heavy_resources, remember_session_state, session_state, viewer_script_text,
+)
 
 try:
     from ocr.realestate_ocr_extractor import extract_re_fields_from_image
 except Exception:
     extract_re_fields_from_image = None
 
+# optional streaming xlsx writer for the session workbook; falls back to openpyxl
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 load_dotenv()
 console = Console()
 
@@ -50,6 +68,32 @@ UA_DICT = {
 
 UA = UA_DICT.get(os.getenv("OS_NAME"), "windows")
 EXTRA_HEADERS = {"Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8"}
+# session workbook columns, in order
+EXCEL_HEADERS = [
+    "Name",
+    "Mortgage Date (original)",
+    "Assignment Date",
+    "Original Lender",
+    "Mortgage Amount",
+    "Property Address",
+    "Search Name",
+    "Entity Index",
+    "Doc Index",
+    "Book",
+    "Page",
+    "Pages",
+    "PDF Viewer URL",
+    "Source URL",
+    "View PDF",
+]
+# written as numbers in the workbook; everything else stays text
+EXCEL_INT_HEADERS = {"Entity Index", "Doc Index", "Pages"}
+# document pages processed side by side (one tab each, sharing the logged-in context)
+REALESTATE_CONCURRENCY = max(1, int(os.getenv("REALESTATE_CONCURRENCY", "4")))
+# one radio per matching entity on the search results page
+ENTITY_RADIO_SELECTOR = "input[name='rdoEntityName']"
+# viewer thumbnails are rendered by script after DOMContentLoaded; wait for them, not a fixed time
+VIEWER_THUMB_SELECTOR = "a[id*='lvThumbnails_lnkThumbnail']"
 
 # load Tesseract path for Windows if needed
 try:
@@ -72,29 +116,38 @@ os.makedirs(REAL_ESTATE_EXCEL_DIR, exist_ok=True)
 
 
 # ---------- Utility Function to find latest Excel file -------------------------
-def images_to_pdf(img_paths, pdf_path):
+def rotate_png(png: bytes) -> bytes:
+    """ Rotate an in-memory PNG screenshot upright with OpenCV's SIMD kernels. """
+    im = cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+    im = cv2.rotate(im, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    # low compression: the PNG only lives until img2pdf and the OCR have read it
+    return cv2.imencode(".png", im, [cv2.IMWRITE_PNG_COMPRESSION, 1])[1].tobytes()
+
+
+def images_to_pdf(images, pdf_path):
+    """ Write PNG images (bytes, already upright) to a single PDF. """
     try:
-        valid_images = []
-        for path in img_paths:
-            try:
-                with Image.open(path) as im:
-                    im.verify()
-                valid_images.append(path)
-            except Exception as e:
-                console.print(f"[yellow]Skipping invalid image {path}: {e}[/yellow]")
+        # img2pdf embeds the PNG streams as-is and rejects broken input itself, so the usual
+        # case needs no PIL decode; images are only checked one by one if that fails
+        try:
+            pdf_bytes = img2pdf.convert(list(images))
+        except Exception:
+            valid_images = []
+            for idx, png in enumerate(images, 1):
+                try:
+                    with Image.open(io.BytesIO(png)) as im:
+                        im.verify()
+                    valid_images.append(png)
+                except Exception as e:
+                    console.print(f"[yellow]Skipping invalid image {idx}: {e}[/yellow]")
 
-        if not valid_images:
-            console.print("[red]No valid images to convert.[/red]")
-            return False
+            if not valid_images:
+                console.print("[red]No valid images to convert.[/red]")
+                return False
+
+            # Convert the list of valid images to a single PDF
+            pdf_bytes = img2pdf.convert(valid_images)
 
-        # Convert the list of valid image paths to a single PDF
-        for tmp_img in valid_images:
-            with Image.open(tmp_img) as im:
-                im = ImageOps.exif_transpose(im)
-                im = im.rotate(90, expand=True)
-                im.save(tmp_img)
-                
-        pdf_bytes = img2pdf.convert(valid_images)
         with open(pdf_path, "wb") as f:
             f.write(pdf_bytes)
 
@@ -105,12 +158,13 @@ def images_to_pdf(img_paths, pdf_path):
         console.print(f"[red]Failed to create PDF: {e}[/red]")
         return False
 
+
 # ---------- Scraper Class -----------------------------------------------------
 class RealEstateIndexScraper:
     def __init__(self) -> None:
         try:
-            self.playwright = None
             self.browser = None
+            self.context = None
             self.page = None
             self.email = TAX_EMAIL
             self.password = TAX_PASSWORD
@@ -119,9 +173,21 @@ class RealEstateIndexScraper:
             self.realestate_search_url = "https://search.gsccca.org/RealEstate/namesearch.asp"
             self.results = []
             self.form_data = {}
+            self._rows_file = None
+            self._rows_writer = None
+            # URL-list status writes run in a thread, at most one at a time (see _save_url_status)
+            self._status_lock = asyncio.Lock()
+            self._status_dirty = False
+            # documents OCR'd at once, off the event loop and apart from the default executor
+            # (PDF writes, workbook build); each fans its ROIs out to the extractor's pool
+            self._ocr_pool = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 4))
+            # worker tab -> its HTML5 viewer tab, navigated per document instead of opened/closed
+            self._viewer_pages = ViewerPages()
+            # set once the site announcement is dismissed; the choice sticks for the session
+            self._banner_handled = asyncio.Event()
             
             # Use global constants defined above
-            self.pdf_dir = PDF_DIR
+            self.pdf_dir = Path(PDF_DIR)
             self.excel_output_dir = REAL_ESTATE_EXCEL_DIR
             console.print(f"[green]Real Estate Data Output directory --> {self.excel_output_dir}[/green]")
         except Exception as e:
@@ -129,7 +195,8 @@ class RealEstateIndexScraper:
             raise
 
 
-    def time_sleep(self, a: int = 2500, b: int = 5000) -> int:
+    @staticmethod
+    def time_sleep(a: int = 2500, b: int = 5000) -> float:
         return random.uniform(a, b)
     
 
@@ -137,10 +204,8 @@ class RealEstateIndexScraper:
         """ Global stop flag to immediately exit scraping if invoked by user. """
         if stop_scraper_flag['realestate']:
             console.print("[yellow]Lien Index Scraper received immediate stop signal. Exiting...[/yellow]")
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            # only this run's context: the shared browser may be serving another scraper
+            await self._close_context()
             raise pw.Error("STOP_REQUESTED")
 
 
@@ -268,7 +333,10 @@ class RealEstateIndexScraper:
         """Save cookies + storage ONLY for login check."""
         try:
             state = await self.page.context.storage_state()
-            Path(out_file).write_text(json.dumps(state, indent=2))
+            # compared against the process-wide copy, so an unchanged login across runs skips the write
+            if not remember_session_state(state):
+                return
+            Path(out_file).write_text(json.dumps(state, separators=(",", ":")))
             print(f"Saved login state to --> {out_file}")
         except Exception as e:
             console.print(f"[red]Failed to dump cookies: {e}[/red]")
@@ -277,11 +345,13 @@ class RealEstateIndexScraper:
     async def already_logged_in(self) -> bool:
         """Check if user is already logged in."""
         try:
-            await self.page.wait_for_timeout(self.time_sleep())
-            all_text = await self.page.evaluate("document.body.innerText")
-            if "logout" in all_text.lower():
-                return True
-            return False
+            # probe for the logout link instead of pulling the whole page text over CDP
+            logout_link = self.page.locator("a[href*='logout' i], a:has-text('Logout')")
+            try:
+                await logout_link.first.wait_for(state="attached", timeout=3000)
+            except pw.TimeoutError:
+                return False
+            return True
 
         except Exception as e:
             print(f"[already_logged_in ERROR] {e}")
@@ -302,15 +372,19 @@ class RealEstateIndexScraper:
             return False
 
 
-    async def check_and_handle_announcement(self):
+    async def check_and_handle_announcement(self, page=None):
         """Check if announcement page loaded; if yes, redirect to realestate_search_url."""
+        if self._banner_handled.is_set():
+            return
+        page = page or self.page
         try:
-            current_url = self.page.url
+            current_url = page.url
             if "Announcement" in current_url:
-                await self.page.select_option("#Options", "dismiss")
-                await self.page.wait_for_timeout(1000)
-                await self.page.click("input[name='Continue']")
+                await page.select_option("#Options", "dismiss")
+                await page.wait_for_timeout(1000)
+                await page.click("input[name='Continue']")
                 print("Announcement page detected. Turning off...")
+                self._banner_handled.set()
         except Exception as e:
             console.print(f"[red]Error handling announcement: {e}[/red]")
             
@@ -319,15 +393,11 @@ class RealEstateIndexScraper:
         """Perform login and save cookies."""
         try:
             await self.page.goto(self.login_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
 
             await self.page.fill("input[name='txtUserID']", self.email)
-            await self.page.wait_for_timeout(self.time_sleep()) 
             await self.page.fill("input[name='txtPassword']", self.password)
-            await self.page.wait_for_timeout(self.time_sleep())
             checkbox = await self.page.query_selector("input[type='checkbox'][name='permanent']")
-            await self.page.wait_for_timeout(self.time_sleep(a=1000, b=1200))
             
             if checkbox:
                 is_checked = await checkbox.is_checked()
@@ -343,11 +413,9 @@ class RealEstateIndexScraper:
                 await self.page.evaluate("document.forms['frmLogin'].submit()")
 
             await self.page.wait_for_load_state("networkidle", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
             
             await self.page.goto(self.realestate_search_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
             
             if await self.already_logged_in():
@@ -367,20 +435,15 @@ class RealEstateIndexScraper:
         try:
             print("Executing Real Estate Term search...")
             await self.page.goto(self.realestate_search_url, wait_until="domcontentloaded", timeout=60000)
-            await self.page.wait_for_timeout(self.time_sleep())
             await self.check_and_handle_announcement()
         except Exception as e:
             console.print(f"[red]Error in start_realestate_search: {e}[/red]")
             
         try:
             await self.page.wait_for_selector("input[name='txtSearchName']")
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='txtPartyType']", self.form_data.get("txtPartyType", "2"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='txtInstrCode']", self.form_data.get("txtInstrCode", "ALL"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='intCountyID']", self.form_data.get("intCountyID", "-1"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             
             include_val = self.form_data.get("bolInclude", "0")
             checkbox_selector = f"input[name='bolInclude'][value='{include_val}']"
@@ -388,17 +451,14 @@ class RealEstateIndexScraper:
                 await self.page.check(checkbox_selector)
             
             await self.page.fill("input[name='txtSearchName']", self.form_data.get("txtSearchName", ""))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.fill("input[name='txtFromDate']", self.form_data.get("txtFromDate", ""))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.fill("input[name='txtToDate']", self.form_data.get("txtToDate", ""))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             
             await self.page.select_option("select[name='MaxRows']", self.form_data.get("MaxRows", "100"))
-            await self.page.wait_for_timeout(self.time_sleep(a=250, b=500))
             await self.page.select_option("select[name='TableType']", self.form_data.get("TableType", "1"))
             
-            await self.page.wait_for_timeout(self.time_sleep())
+            # one short human-like pause before submitting; the form itself needs no waits
+            await self.page.wait_for_timeout(self.time_sleep(a=200, b=500))
             await self.page.click("#btnSubmit")
         except Exception as e:
             console.print(f"[red]Error filling real estate form: {e}[/red]\n{traceback.format_exc()}")
@@ -409,7 +469,11 @@ class RealEstateIndexScraper:
         """Step: Extract ALL document URLs first, then save them to CSV for processing."""
         try:
             print(f"Loading Real Estate Search results...")
-            await self.page.wait_for_timeout(self.time_sleep(a=4000, b=5000))
+            # returns as soon as the entity list is in the DOM instead of sleeping 4-5s
+            try:
+                await self.page.wait_for_selector(ENTITY_RADIO_SELECTOR, state="attached", timeout=15000)
+            except pw.TimeoutError:
+                pass  # no entities for this name, handled as an empty result below
 
             search_name = (self.form_data.get("txtSearchName") or "").strip()
             safe_search = re.sub(r"[^a-zA-Z0-9]+", "_", search_name).strip("_") or "search"
@@ -419,36 +483,36 @@ class RealEstateIndexScraper:
             self.csv_path = os.path.join(self.excel_output_dir, f"{safe_search}_realestate_urls_{ts}.csv")
             self.excel_path = os.path.join(self.excel_output_dir, f"realestate_index_{safe_search}_{ts}.xlsx")
 
-            radios = await self.page.query_selector_all("input[name='rdoEntityName']")
+            # locators resolve in the browser: a count and an nth() pick, no element handle per radio
+            radios = self.page.locator(ENTITY_RADIO_SELECTOR)
+            entity_count = await radios.count()
             print("*" * 50)
-            console.print(f"[cyan]Found {len(radios)} entity result(s) for '{search_name}'[/cyan]")
+            console.print(f"[cyan]Found {entity_count} entity result(s) for '{search_name}'[/cyan]")
 
             results_df = pd.DataFrame(columns=["url", "status", "search_name", "entity_index", "doc_index"])
 
-            for entity_idx in range(1, len(radios) + 1):
+            for entity_idx in range(1, entity_count + 1):
                 # if len(results_df) >= 10:
                 #     break
                 await self.stop_check()
                 try:
-                    # Refresh the radios list to avoid staleness
-                    current_radios = await self.page.query_selector_all("input[name='rdoEntityName']")
-                    radio = current_radios[entity_idx - 1] if entity_idx - 1 < len(current_radios) else None
-                    if not radio:
+                    # re-resolved on every use, so never stale after go_back()
+                    if await radios.count() < entity_idx:
                         console.print(f"[yellow]Radio button for entity {entity_idx} not found[/yellow]")
                         continue
+                    radio = radios.nth(entity_idx - 1)
 
                     await radio.scroll_into_view_if_needed()
-                    await radio.wait_for_element_state("visible", timeout=10000)
+                    await radio.wait_for(state="visible", timeout=10000)
                     await radio.click()
 
                     # Display Details
                     await self.page.click("#btnDisplayDetails")
                     await self.page.wait_for_load_state("domcontentloaded", timeout=20000)
-                    await self.page.wait_for_timeout(self.time_sleep())
                     await self.check_and_handle_announcement()
 
                     # ---- Extract GE/GR document links for this entity (NO navigation here) ----
-                    await self.page.wait_for_timeout(self.time_sleep(a=500, b=1200))
+                    await self.page.wait_for_selector("table tr", state="attached", timeout=15000)
 
                     hrefs = await self.page.eval_on_selector_all(
                         "a[href*='final.asp']",
@@ -485,12 +549,13 @@ class RealEstateIndexScraper:
                         })
                         results_df = pd.concat([results_df, tmp_df], ignore_index=True)
 
-                    # Go back to entity selection page
+                    # Go back to entity selection page; the details view is a form post with no
+                    # href to goto, so history is the one-step way back. Resolve on commit and
+                    # let the radio wait below decide when the list is usable.
                     back_ok = False
                     try:
-                        await self.page.go_back()
-                        await self.page.wait_for_load_state("domcontentloaded", timeout=20000)
-                        await self.page.wait_for_timeout(self.time_sleep())
+                        await self.page.go_back(wait_until="commit", timeout=15000)
+                        await self.page.wait_for_selector(ENTITY_RADIO_SELECTOR, state="attached", timeout=15000)
                         back_ok = True
                     except Exception:
                         back_ok = False
@@ -499,8 +564,7 @@ class RealEstateIndexScraper:
                         # Recovery: go back to search page and re-run the search
                         console.print("[yellow]Recovery: returning to Real Estate search page and re-searching...[/yellow]")
                         await self.start_realestate_search()
-                        await self.page.wait_for_timeout(self.time_sleep())
-                        await self.page.wait_for_selector("input[name='rdoEntityName']", timeout=30000)
+                        await self.page.wait_for_selector(ENTITY_RADIO_SELECTOR, timeout=30000)
 
                 except Exception as e:
                     console.print(f"[red]Error extracting URLs for entity {entity_idx}: {e}[/red]")
@@ -509,7 +573,7 @@ class RealEstateIndexScraper:
             # save urls list
             results_df.drop_duplicates(subset=["url"], inplace=True)
             results_df.reset_index(drop=True, inplace=True)
-            results_df.to_csv(self.csv_path, index=False)
+            await asyncio.to_thread(results_df.to_csv, self.csv_path, index=False)
             console.print(f"[green]Success -> Search results' URLs saved to CSV at {self.csv_path}[/green]")
 
         except Exception as e:
@@ -530,58 +594,117 @@ class RealEstateIndexScraper:
 
         console.print(f"[cyan]Initiating Real Estate data extraction... Total URLs: {len(df_urls)}[/cyan]")
 
+        queue = asyncio.Queue()
         for idx, row in df_urls.iterrows():
-            if str(row.get("status", "")).strip().lower() == "done":
-                continue
+            if str(row.get("status", "")).strip().lower() != "done":
+                queue.put_nowait((idx, row))
 
-            await self.stop_check()
+        async def worker(page):
+            while not queue.empty():
+                idx, row = queue.get_nowait()
+                await self._process_result_url(page, idx, row, df_urls)
 
-            url = str(row.get("url", "")).strip()
-            search_name = str(row.get("search_name", "")).strip()
-            entity_idx = int(row.get("entity_index", 0) or 0)
-            doc_idx = int(row.get("doc_index", 0) or 0)
+        # document pages are independent: a few tabs share the logged-in context, main page first
+        pages = [self.page]
+        workers = []
+        try:
+            for _ in range(min(REALESTATE_CONCURRENCY, queue.qsize()) - 1):
+                extra = await self.page.context.new_page()
+                await extra.route("**/*", block_heavy_resources)
+                pages.append(extra)
+            workers = [asyncio.create_task(worker(page)) for page in pages]
+            await asyncio.gather(*workers)
 
-            if not url:
-                df_urls.at[idx, "status"] = "Done"
-                df_urls.to_csv(self.csv_path, index=False)
-                continue
+        except Exception as e:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            console.print(f"[red]Error in process_result_urls: {e}[/red]")
+        finally:
+            for extra in pages[1:]:
+                try:
+                    await extra.close()
+                except pw.Error:
+                    pass  # browser already closed by a stop request
+            await self._viewer_pages.close()
+
+
+    async def _save_url_status(self, df: pd.DataFrame):
+        """ Rewrite the URL list CSV in a thread; marks made while a write is running are folded
+        into one follow-up write instead of each rewriting the file. """
+        self._status_dirty = True
+        if self._status_lock.locked():
+            return  # the running writer picks this change up
+        async with self._status_lock:
+            while self._status_dirty:
+                self._status_dirty = False
+                # snapshot on the loop, so the thread never reads a frame other tabs are marking
+                snapshot = df.copy()
+                await asyncio.to_thread(snapshot.to_csv, self.csv_path, index=False)
+
+
+    async def _process_result_url(self, page, idx, row, df_urls: pd.DataFrame):
+        """Open one document URL in `page`, parse and save it, then mark it Done in the CSV."""
+        await self.stop_check()
 
-            print("-" * 50)
-            console.print(f"[green]{idx + 1}. Processing Entity {entity_idx}, Doc {doc_idx}[/green]")
-            console.print(f"[blue]URL: {url}[/blue]")
+        url = str(row.get("url", "")).strip()
+        search_name = str(row.get("search_name", "")).strip()
+        entity_idx = int(row.get("entity_index", 0) or 0)
+        doc_idx = int(row.get("doc_index", 0) or 0)
 
-            try:
-                await self.page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                await self.page.wait_for_timeout(self.time_sleep())
-                await self.check_and_handle_announcement()
-
-                data = await self.parse_realestate_data(
-                    search_name=search_name,
-                    entity_idx=entity_idx,
-                    doc_idx=doc_idx,
-                    source_url=url,
-                )
+        if not url:
+            df_urls.at[idx, "status"] = "Done"
+            await self._save_url_status(df_urls)
+            return
 
-                if data is None:
-                    console.print(f"[yellow]Skipped (cancelled/foreclosed) -> {row['url']}[/yellow]")
-                elif data:
-                    self.results.append(data)
-                    await self._append_result_to_excel(data)
-                    console.print(f"[cyan]Saved record for Entity {entity_idx}, Doc {doc_idx}[/cyan]")
-                else:
-                    console.print(f"[yellow]No data extracted for Entity {entity_idx}, Doc {doc_idx}[/yellow]")
+        print("-" * 50)
+        console.print(f"[green]{idx + 1}. Processing Entity {entity_idx}, Doc {doc_idx}[/green]")
+        console.print(f"[blue]URL: {url}[/blue]")
 
-                df_urls.at[idx, "status"] = "Done"
-                df_urls.to_csv(self.csv_path, index=False)
+        try:
+            # the detail page is server-rendered and only read for its viewer <script>: fetch it
+            # over the context's cookie-sharing HTTP client, no tab navigation or DOM build
+            html_text = None
+            response = await page.context.request.get(url, timeout=60000)
+            if response.ok and "Announcement" not in response.url:
+                html_text = await response.text()
+            else:
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+                await self.check_and_handle_announcement(page)
+
+            data = await self.parse_realestate_data(
+                search_name=search_name,
+                entity_idx=entity_idx,
+                doc_idx=doc_idx,
+                source_url=url,
+                page=page,
+                html_text=html_text,
+            )
 
-            except Exception as e:
-                console.print(f"[red]Error processing URL {url}: {e}[/red]\n{traceback.format_exc()}")
-                # keep it un-done for resume
-                continue
+            if data is None:
+                console.print(f"[yellow]Skipped (cancelled/foreclosed) -> {row['url']}[/yellow]")
+            elif data:
+                self.results.append(data)
+                await self._append_result_to_excel(data)
+                console.print(f"[cyan]Saved record for Entity {entity_idx}, Doc {doc_idx}[/cyan]")
+            else:
+                console.print(f"[yellow]No data extracted for Entity {entity_idx}, Doc {doc_idx}[/yellow]")
 
+            df_urls.at[idx, "status"] = "Done"
+            await self._save_url_status(df_urls)
+
+        except Exception as e:
+            console.print(f"[red]Error processing URL {url}: {e}[/red]\n{traceback.format_exc()}")
+            # keep it un-done for resume
 
-    async def parse_realestate_data(self, search_name: str, entity_idx: int, doc_idx: int, source_url: str):
-        """Parse one Real Estate document detail page and generate a PDF from the HTML5 viewer."""
+
+    async def parse_realestate_data(
+        self, search_name: str, entity_idx: int, doc_idx: int, source_url: str, page=None,
+        html_text: str | None = None,
+    ):
+        """Parse one Real Estate document detail page (`html_text`, else `page`'s DOM) and
+        generate a PDF from the HTML5 viewer."""
+        page = page or self.page
         await self.stop_check()
 
         data = {
@@ -591,19 +714,16 @@ class RealEstateIndexScraper:
             "Source URL": source_url,
         }
 
-        popup = None
         try:
-            html_text = await self.page.content()
-            soup = BeautifulSoup(html_text, "html.parser")
+            if html_text is None:
+                html_text = await page.content()
 
             # ---------- PDF Viewer URL Extraction ----------
-            viewer_script = soup.find("script", string=lambda t: t and "ViewImage" in t)
-            if not viewer_script or not viewer_script.string:
+            script_text = viewer_script_text(html_text)
+            if not script_text:
                 data["PDF Viewer URL"] = "ADD_TAG"
                 return data
 
-            script_text = viewer_script.string
-
             # NOTE: Keep existing tags/vars where possible; placeholders if missing
             reid_match = re.search(r"var iREID\s*=\s*(\d+);", script_text)  # RealEstate id
             if not reid_match:
@@ -631,13 +751,15 @@ class RealEstateIndexScraper:
             )
             data["PDF Viewer URL"] = viewer_url
 
-            popup = await self.page.context.new_page()
+            popup = await self._viewer_pages.get(page)
             await popup.goto(viewer_url, wait_until="domcontentloaded", timeout=60000)
-            await popup.wait_for_timeout(6000)
+            try:
+                await popup.wait_for_selector(VIEWER_THUMB_SELECTOR, state="attached", timeout=15000)
+            except pw.TimeoutError:
+                pass  # counted as zero pages below
 
             # --- Collect thumbnails/pages ---
-            thumb_links = await popup.query_selector_all("a[id*='lvThumbnails_lnkThumbnail']")
-            pages_count = len(thumb_links)
+            pages_count = await popup.locator(VIEWER_THUMB_SELECTOR).count()
             data["Pages"] = pages_count
 
             if pages_count == 0:
@@ -645,25 +767,32 @@ class RealEstateIndexScraper:
                 data["Real Estate PDF"] = ""
                 return data
 
-            screenshot_paths = []
+            page_images = []
 
             # Try to set fit window once (best-effort)
             try:
                 await popup.wait_for_selector("td.vtm_zoomSelectCell select", timeout=10000)
                 await popup.select_option("td.vtm_zoomSelectCell select", "fitwindow")
-                await popup.wait_for_timeout(1500)
             except Exception:
                 pass
 
-            # Rotate right once (best-effort, matches lien flow)
+            # Rotate right once (best-effort, matches lien flow); wait for the canvas to be
+            # painted, then redrawn, instead of sleeping a fixed time around each step
             try:
+                await popup.wait_for_function(
+                    VIEWER_CANVAS_STATE_JS, arg=VIEWER_CANVAS_SELECTOR, timeout=15000
+                )
+                before_rotate = await popup.evaluate(VIEWER_CANVAS_STATE_JS, VIEWER_CANVAS_SELECTOR)
                 await popup.locator('img[title="Rotate Right"]').click()
-                await popup.wait_for_timeout(1000)
+                await popup.wait_for_function(
+                    f"(sel) => {{ const s = ({VIEWER_CANVAS_STATE_JS})(sel); return s && s !== {json.dumps(before_rotate)}; }}",
+                    arg=VIEWER_CANVAS_SELECTOR, timeout=4000,
+                )
             except Exception:
                 pass
 
-            await popup.wait_for_selector("div.vtm_imageClipper canvas", timeout=20000, state="attached")
-            canvas = await popup.query_selector("div.vtm_imageClipper canvas")
+            await popup.wait_for_selector(VIEWER_CANVAS_SELECTOR, timeout=20000, state="attached")
+            canvas = await popup.query_selector(VIEWER_CANVAS_SELECTOR)
 
             safe_base = f"RE_Entity_{entity_idx}_Doc_{doc_idx}"
             # Best effort: read header for book/page
@@ -677,29 +806,32 @@ class RealEstateIndexScraper:
 
             await self.stop_check()
             try:
-                await popup.wait_for_timeout(self.time_sleep())
                 if not canvas:
                     console.print("[yellow]Canvas not found for screenshot[/yellow]")
 
-                screenshot_path = Path(os.path.join(self.pdf_dir, f"{safe_base}_Page_{page_num}.png"))
-                await canvas.screenshot(path=str(screenshot_path), timeout=30000)
-                screenshot_paths.append(screenshot_path)
+                # keep the screenshot in memory, no temp PNG round-trip (like the lien scraper)
+                page_png = await canvas.screenshot(timeout=30000)
+                page_images.append(await asyncio.to_thread(rotate_png, page_png))
             except Exception as e:
                 console.print(f"[red]Error processing thumbnail: {e}[/red]")
 
-            if not screenshot_paths:
+            if not page_images:
                 data["Real Estate PDF"] = ""
                 return data
 
-            pdf_path = Path(os.path.join(self.pdf_dir, f"{safe_base}.pdf"))
-            images_to_pdf(screenshot_paths, pdf_path)
-
-            # cleanup pngs
-            # for p in screenshot_paths:
-            #     try:
-            #         os.remove(p)
-            #     except FileNotFoundError:
-            #         pass
+            pdf_path = self.pdf_dir / f"{safe_base}.pdf"
+            # OCR starts now and runs alongside the PDF write, both off the event loop
+            ocr_job = None
+            if extract_re_fields_from_image:
+                ocr_job = asyncio.get_running_loop().run_in_executor(self._ocr_pool, functools.partial(
+                    extract_re_fields_from_image,
+                    img_path=f"{safe_base}_Page_{page_num}.png",  # label only, image is in memory
+                    img_bytes=page_images[0],                 # or loop all pages if you want later
+                    use_paddle=False,       # or hardcode True/False
+                    cache_dir=".re_ocr_cache",                # optional cache
+                    debug=False
+                ))
+            await asyncio.to_thread(images_to_pdf, page_images, pdf_path)
 
             data["Real Estate PDF"] = str(pdf_path)
 
@@ -717,13 +849,8 @@ class RealEstateIndexScraper:
                     return None
 
                 # Skip cancelled/foreclosed docs (using OCR engine dict result)
-                if extract_re_fields_from_image and screenshot_paths:
-                    fields = extract_re_fields_from_image(
-                        img_path=str(screenshot_paths[0]),        # or loop all pages if you want later
-                        use_paddle=False,       # or hardcode True/False
-                        cache_dir=".re_ocr_cache",                # optional cache
-                        debug=False
-                    )
+                if ocr_job is not None:
+                    fields = await ocr_job
 
                     # if the OCR layer says skip — skip it
                     if fields.get("SKIP_REASON"):
@@ -745,12 +872,6 @@ class RealEstateIndexScraper:
         except Exception as e:
             console.print(f"[bold red]Fatal error in parse_realestate_data: {e}[/bold red]\n{traceback.format_exc()}")
             return data
-        finally:
-            try:
-                if popup and popup != self.page:
-                    await popup.close()
-            except Exception:
-                pass
 
 
     async def parse_documents(self, search_name: str, entity_idx: int):
@@ -766,63 +887,133 @@ class RealEstateIndexScraper:
             return v.replace("\x00", "").strip()
         return v
 
+    def _rows_path(self) -> str:
+        """Row log that backs the session workbook until _rows_to_excel builds it."""
+        return os.path.splitext(self.excel_path)[0] + "_rows.csv"
+
+
     async def _append_result_to_excel(self, data: dict):
-        """Append ONE row to an Excel file (atomic write), similar to lien scraper."""
+        """Append ONE row to the session's row log (CSV, flushed per row; xlsx built at the end)."""
         if not getattr(self, "excel_path", None):
             # fallback
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.excel_path = os.path.join(self.excel_output_dir, f"realestate_index_{ts}.xlsx")
 
-        headers = [
-            "Name",
-            "Mortgage Date (original)",
-            "Assignment Date",
-            "Original Lender",
-            "Mortgage Amount",
-            "Property Address",
-            "Search Name",
-            "Entity Index",
-            "Doc Index",
-            "Book",
-            "Page",
-            "Pages",
-            "PDF Viewer URL",
-            "Source URL",
-            "View PDF",
-        ]
+        if self._rows_file is None:
+            rows_path = self._rows_path()
+            is_new = not os.path.exists(rows_path)
+            self._rows_file = open(rows_path, "a", newline="", encoding="utf-8")
+            self._rows_writer = csv.writer(self._rows_file)
+            if is_new:
+                self._rows_writer.writerow(EXCEL_HEADERS)
 
         row_vals = []
-        for h in headers:
+        for h in EXCEL_HEADERS:
             if h == "View PDF":
-                pdf_path = str(data.get("Real Estate PDF", "") or "")
-                if pdf_path:
-                    pdf_name = os.path.basename(pdf_path)
-                    view_path = pdf_path.replace(os.sep, "/")
-                    row_vals.append(f'=HYPERLINK("file:///{view_path}", "{pdf_name}")')
-                else:
-                    row_vals.append("")
+                row_vals.append(str(data.get("Real Estate PDF", "") or ""))  # linked in _rows_to_excel
             else:
                 row_vals.append(self._excel_safe(data.get(h, "")))
 
-        if os.path.exists(self.excel_path):
-            wb = load_workbook(self.excel_path)
-            ws = wb.active
-        else:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Real Estate Data"
-            ws.append(headers)
+        self._rows_writer.writerow(row_vals)
+        self._rows_file.flush()
+        console.print(f"[bold green]Saved record to --> {self._rows_path()}[/bold green]")
+
+
+    def _rows_to_excel(self):
+        """
+        Build the session workbook (clickable PDF links) from the row log in one streaming pass.
+        Uses xlsxwriter constant_memory with native links when available, else openpyxl write-only.
+        """
+        if self._rows_file is not None:
+            self._rows_file.close()
+            self._rows_file = None
+
+        try:
+            rows_path = self._rows_path() if getattr(self, "excel_path", None) else ""
+            if not rows_path or not os.path.exists(rows_path):
+                return None
+
+            pdf_col = EXCEL_HEADERS.index("View PDF")
+            int_cols = [EXCEL_HEADERS.index(h) for h in EXCEL_INT_HEADERS]
+            # every PDF of the session lives in pdf_dir: build its file URI prefix once
+            pdf_prefix = str(self.pdf_dir) + os.sep
+            pdf_base = f"file:///{self.pdf_dir.as_posix()}/"
+
+            def pdf_link(value: str):
+                """ (file URI, display name) for a stored PDF path. """
+                if value.startswith(pdf_prefix):
+                    name = value[len(pdf_prefix):]
+                    return pdf_base + name, name
+                return "file:///" + value.replace(os.sep, "/"), os.path.basename(value)
+
+            tmp_path = self.excel_path + ".tmp.xlsx"
+            count = 0
+            with open(rows_path, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # header
+
+                if xlsxwriter is not None:
+                    workbook = xlsxwriter.Workbook(tmp_path, {"constant_memory": True, "strings_to_urls": False})
+                    try:
+                        sheet = workbook.add_worksheet("Real Estate Data")
+                        sheet.write_row(0, 0, EXCEL_HEADERS)
+                        # constant_memory flushes row by row, so each row is written complete and in order
+                        for row in reader:
+                            count += 1
+                            for c, value in enumerate(row):
+                                if c == pdf_col and value:
+                                    url, name = pdf_link(value)
+                                    sheet.write_url(count, c, url, string=name)
+                                elif c in int_cols and value.isdigit():
+                                    sheet.write_number(count, c, int(value))
+                                elif value:
+                                    sheet.write_string(count, c, value)
+                    finally:
+                        workbook.close()
+                else:
+                    wb = Workbook(write_only=True)
+                    ws = wb.create_sheet("Real Estate Data")
+                    ws.append(EXCEL_HEADERS)
+                    for row in reader:
+                        for c in int_cols:
+                            if row[c].isdigit():
+                                row[c] = int(row[c])
+                        pdf_path = row[pdf_col]
+                        if pdf_path:
+                            # a native hyperlink, not a =HYPERLINK() formula Excel re-parses
+                            url, pdf_name = pdf_link(pdf_path)
+                            cell = WriteOnlyCell(ws, value=pdf_name)
+                            cell.hyperlink = url
+                            cell.style = "Hyperlink"
+                            row[pdf_col] = cell
+                        ws.append(row)
+                        count += 1
+                    wb.save(tmp_path)
+
+            # atomic replace so a crash mid-write never leaves a truncated workbook
+            os.replace(tmp_path, self.excel_path)
+            os.remove(rows_path)
+            console.print(f"[bold green]Saved {count} records to --> {self.excel_path}[/bold green]")
+            return self.excel_path
+
+        except Exception as e:
+            console.print(f"[red]Error in _rows_to_excel: {e}[/red]")
+            return None
 
-        ws.append(row_vals)
 
-        tmp_path = self.excel_path + ".tmp"
-        wb.save(tmp_path)
-        os.replace(tmp_path, self.excel_path)
-        console.print(f"[bold green]Saved record to --> {self.excel_path}[/bold green]")
+    async def _close_context(self):
+        """ Close this run's browser context (idempotent; the shared browser stays up). """
+        context, self.context = self.context, None
+        if context:
+            try:
+                await context.close()
+            except pw.Error:
+                pass  # already closed by a stop request
 
 
     def save_results_to_excel(self, filename_prefix="realestate_index"):
         """Legacy full-save. If incremental Excel was used, this simply returns the session excel path."""
+        self._rows_to_excel()  # no-op once the session workbook has been built
         if getattr(self, "excel_path", None) and os.path.exists(self.excel_path):
             console.print(f"[green]Session Excel already exists -> {self.excel_path}[/green]")
             return self.excel_path
@@ -832,16 +1023,23 @@ class RealEstateIndexScraper:
             return None
 
         try:
-            df = pd.DataFrame(self.results)
-            df.drop_duplicates(subset=["Search Name", "Real Estate PDF"], inplace=True)
-            df.reset_index(drop=True, inplace=True)
-
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             final_filename = f"{filename_prefix}_{ts}.xlsx"
             final_path = os.path.join(self.excel_output_dir, final_filename)
 
-            with pd.ExcelWriter(final_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Real Estate Data', index=False)
+            # stream rows through a write-only workbook; no DataFrame / styled cell objects
+            columns = list(dict.fromkeys(k for rec in self.results for k in rec))
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Real Estate Data")
+            ws.append(columns)
+            seen = set()
+            for rec in self.results:
+                key = (rec.get("Search Name"), rec.get("Real Estate PDF"))
+                if key in seen:
+                    continue
+                seen.add(key)
+                ws.append([rec.get(c) for c in columns])
+            wb.save(final_path)
 
             console.print(f"[green]Real Estate Excel saved -> {final_path}[/green]")
             return final_path
@@ -855,21 +1053,13 @@ class RealEstateIndexScraper:
     async def scrape(self, formdata: dict):
         try:
             self.form_data = formdata
-            self.playwright = await pw.async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=HEADLESS,
-                channel="chrome",
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--start-maximized",
-                    "--no-proxy-server",
-                ]
-            )
+            # warm browser shared across runs; only the context below is per run
+            self.browser = await acquire_browser(HEADLESS)
 
             print("Starting Real Estate Index Scraper...")
             print(f"Screen Resolution set to --> {WIDTH}x{HEIGHT}")
             context = await self.browser.new_context(
-                storage_state=STATE_FILE if STATE_FILE.exists() else None,
+                storage_state=session_state(STATE_FILE),
                 user_agent=UA,
                 locale=LOCALE,
                 timezone_id=TIMEZONE,
@@ -879,29 +1069,20 @@ class RealEstateIndexScraper:
                 bypass_csp=True,
                 ignore_https_errors=False, 
             )
-            self.page = await context.new_page()
             self.context = context
+            self.page = await context.new_page()
+
+            # reuse the session saved in cookies.json, full login only when it has expired
+            await self.page.goto(self.realestate_search_url, wait_until="domcontentloaded", timeout=60000)
+            await self.check_and_handle_announcement()
 
-            # login if needed
-            await self.page.goto("https://google.com", wait_until="domcontentloaded")
-            await self.page.wait_for_timeout(self.time_sleep())
-            if STATE_FILE.exists():
-                # await context.add_cookies(json.loads(Path(STATE_FILE).read_text())["cookies"])
-                await self.page.goto(self.homepage_url, wait_until="domcontentloaded", timeout=60000)
-                await self.check_and_handle_announcement()
-            else:
-                await self.page.goto(self.login_url, wait_until="domcontentloaded")
-                await self.check_and_handle_announcement()
-                if not await self.check_session():
-                    print("Attempting fresh login...")
-                    await self.login()
-                    await self.page.wait_for_timeout(self.time_sleep())
-                        
             await self.stop_check()
             if not await self.check_session():
                 console.print("[yellow]Session invalid... logging in again...[/yellow]")
                 await self.login()
-                await self.page.wait_for_timeout(self.time_sleep())
+
+            # text-only scraping from here on; viewer popups are separate pages and stay unblocked
+            await self.page.route("**/*", block_heavy_resources)
 
             # Start real estate index search
             await self.start_realestate_search()
@@ -913,8 +1094,9 @@ class RealEstateIndexScraper:
             console.print(f"[red]Error in scrape method: {e}[/red]")
             traceback.print_exc()
         finally:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            # also on a stop request, so every row scraped so far lands in the workbook;
+            # built in a thread while the browser context shuts down
+            await asyncio.gather(asyncio.to_thread(self._rows_to_excel), self._close_context())
+            # the loop is shared with other runs: wait out in-flight OCR in a thread, not on it
+            await asyncio.to_thread(self._ocr_pool.shutdown, wait=True)
 